@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""
+Dump the seeded bikes and tunes data to a fixture for
+``populate_database.py --from-fixtures``
+
+Run this against a freshly seeded database: every row in the bikes and tunes
+apps is written out, plus only the user accounts those rows point at.
+"""
+
+import io
+import json
+import logging
+import os
+import sys
+import django
+
+# Setup Django environment
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'revsync.settings')
+django.setup()
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db.models import Q
+
+logger = logging.getLogger(__name__)
+
+SEED_FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'seed_data', 'seed_fixture.json')
+
+
+def dump_records(*labels, **options):
+    """Run dumpdata into memory and return the decoded records"""
+    buffer = io.StringIO()
+    call_command('dumpdata', *labels, stdout=buffer, **options)
+    return json.loads(buffer.getvalue())
+
+
+def main():
+    """Write the seed fixture"""
+    User = get_user_model()
+    # Only the creator and collection-owner accounts, not every user in the database
+    seed_user_pks = list(User.objects.filter(
+        Q(tune_creator_profile__isnull=False) | Q(created_collections__isnull=False)
+    ).values_list('pk', flat=True).distinct())
+
+    records = []
+    if seed_user_pks:
+        records += dump_records(
+            User._meta.label, primary_keys=','.join(str(pk) for pk in seed_user_pks)
+        )
+    records += dump_records('bikes', 'tunes')
+
+    with open(SEED_FIXTURE, 'w') as fixture:
+        json.dump(records, fixture)
+    logger.info("Wrote %d records to %s", len(records), SEED_FIXTURE)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
@@ -2,15 +2,37 @@
 """
 Comprehensive database population script for RevSync
 Populates motorcycle and tune databases with realistic data
+
+Options:
+    --force                  re-run the seed even if data already exists
+    --from-fixtures          load seed_data/seed_fixture.json (written by
+                             dump_seed.py) instead of building the rows
+
+Environment:
+    REVSYNC_BULK_BATCH_SIZE  rows per bulk INSERT (default 1000); lower it
+                             on memory-constrained machines
+    REVSYNC_FORCE_SEED       re-run the seed even if data already exists
+                             (same as passing --force)
 """
 
+import io
+import json
+import logging
 import os
 import sys
+from types import MappingProxyType
 import django
-from django.contrib.auth.models import User
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.db import connection, connections, models, transaction
+from django.db.models.fields import AutoFieldMixin
+from django.utils import timezone
 from decimal import Decimal
 from datetime import datetime, date, timedelta
 import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Setup Django environment
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -26,567 +48,576 @@ from tunes.models import (
     TuneCompatibility, TuneReview, TuneCollection, TuneCollectionItem
 )
 
+logger = logging.getLogger(__name__)
 
-def create_manufacturers():
-    """Create motorcycle manufacturers"""
-    manufacturers_data = [
-        {"name": "Yamaha", "country": "Japan", "founded_year": 1955, "website": "https://yamaha-motor.com"},
-        {"name": "Honda", "country": "Japan", "founded_year": 1946, "website": "https://honda.com"},
-        {"name": "Kawasaki", "country": "Japan", "founded_year": 1896, "website": "https://kawasaki.com"},
-        {"name": "Suzuki", "country": "Japan", "founded_year": 1909, "website": "https://suzuki.com"},
-        {"name": "Ducati", "country": "Italy", "founded_year": 1926, "website": "https://ducati.com"},
-        {"name": "BMW", "country": "Germany", "founded_year": 1916, "website": "https://bmw-motorrad.com"},
-        {"name": "KTM", "country": "Austria", "founded_year": 1934, "website": "https://ktm.com"},
-        {"name": "Aprilia", "country": "Italy", "founded_year": 1945, "website": "https://aprilia.com"},
-        {"name": "Triumph", "country": "United Kingdom", "founded_year": 1902, "website": "https://triumph.co.uk"},
-        {"name": "Harley-Davidson", "country": "United States", "founded_year": 1903, "website": "https://harley-davidson.com"},
-        {"name": "Indian Motorcycle", "country": "United States", "founded_year": 1901, "website": "https://indianmotorcycle.com"},
-        {"name": "Moto Guzzi", "country": "Italy", "founded_year": 1921, "website": "https://motoguzzi.com"},
-        {"name": "MV Agusta", "country": "Italy", "founded_year": 1945, "website": "https://mvagusta.com"},
-        {"name": "Zero Motorcycles", "country": "United States", "founded_year": 2006, "website": "https://zeromotorcycles.com"},
-        {"name": "Energica", "country": "Italy", "founded_year": 2014, "website": "https://energicamotor.com"},
+User = get_user_model()
+
+# Hash the seed passwords once; each make_password() call runs the full
+# PBKDF2 work factor, so hashing per user dominates the creator step.
+DEFAULT_PASSWORD_HASH = make_password("defaultpass123")
+ADMIN_PASSWORD_HASH = make_password("admin123")
+
+# bulk_create batch sizes. PostgreSQL caps a statement at 65535 bind
+# parameters, so rows per batch x columns must stay below that: 1000 rows
+# covers the narrow tables, while wide tables such as Motorcycle (~50
+# columns) use at most 500 (500 x 50 = 25k parameters).
+BULK_BATCH_SIZE = int(os.environ.get("REVSYNC_BULK_BATCH_SIZE", "1000"))
+WIDE_BULK_BATCH_SIZE = min(BULK_BATCH_SIZE, 500)
+
+SEED_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'seed_data')
+SEED_FIXTURE = os.path.join(SEED_DATA_DIR, 'seed_fixture.json')
+
+
+def load_seed_data(name):
+    """Load a static seed table from seed_data/<name>.json"""
+    with open(os.path.join(SEED_DATA_DIR, f"{name}.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def freeze_seed_rows(rows):
+    """Return seed rows as a tuple of read-only mappings"""
+    return tuple(MappingProxyType(row) for row in rows)
+
+
+# Seed data is built once at import and kept read-only so the create_*
+# helpers can be re-run in the same process without mutating it.
+MANUFACTURERS_DATA = freeze_seed_rows(load_seed_data("manufacturers"))
+ENGINE_TYPES_DATA = freeze_seed_rows(load_seed_data("engine_types"))
+ECU_TYPES_DATA = freeze_seed_rows(load_seed_data("ecu_types"))
+
+# Motorcycle rows are stored as (manufacturer name, category name, fields)
+# so instances can be built without copying or popping from each row.
+MOTORCYCLES_DATA = tuple(
+    (row.pop("manufacturer"), row.pop("category"), MappingProxyType(row))
+    for row in load_seed_data("motorcycles")
+)
+
+BIKE_CATEGORIES = (
+    'sport', 'supersport', 'naked', 'touring', 'cruiser', 'adventure',
+    'dual_sport', 'dirt_bike', 'scooter', 'electric', 'cafe_racer'
+)
+
+TUNE_CATEGORIES = ('performance', 'economy', 'racing', 'track', 'street', 'touring', 'custom')
+
+TUNE_TYPES = ('flash', 'piggyback', 'fuel_controller', 'ignition_map', 'full_system')
+
+SAFETY_RATINGS_DATA = freeze_seed_rows([
+    {
+        "level": "LOW",
+        "description": "Minimal risk with conservative tuning parameters",
+        "color_code": "#28a745",
+        "warning_text": "This tune has been tested and verified safe for street use.",
+        "requires_consent": False,
+        "max_downloads": 5
+    },
+    {
+        "level": "MEDIUM",
+        "description": "Moderate risk with enhanced performance parameters",
+        "color_code": "#ffc107",
+        "warning_text": "This tune modifies engine parameters. Use with caution.",
+        "requires_consent": True,
+        "max_downloads": 3
+    },
+    {
+        "level": "HIGH",
+        "description": "High risk with aggressive tuning for experienced users",
+        "color_code": "#fd7e14",
+        "warning_text": "This tune significantly modifies engine behavior. Professional installation recommended.",
+        "requires_consent": True,
+        "max_downloads": 2
+    },
+    {
+        "level": "CRITICAL",
+        "description": "Extreme modifications for track use only",
+        "color_code": "#dc3545",
+        "warning_text": "WARNING: Track use only. May void warranty and damage engine.",
+        "requires_consent": True,
+        "max_downloads": 1
+    }
+])
+
+CREATORS_DATA = freeze_seed_rows([
+    {
+        "username": "dyno_master",
+        "email": "dyno@revsync.com",
+        "business_name": "DynoMaster Tuning",
+        "bio": "Professional motorcycle tuner with 15+ years experience",
+        "specialties": ["Sport bikes", "Track tuning", "Dyno testing"],
+        "experience_years": 15,
+        "is_verified": True,
+        "verification_level": "expert"
+    },
+    {
+        "username": "speed_demon_tunes",
+        "email": "speed@revsync.com",
+        "business_name": "Speed Demon Performance",
+        "bio": "Specializing in maximum performance street tunes",
+        "specialties": ["Street performance", "Yamaha", "Kawasaki"],
+        "experience_years": 8,
+        "is_verified": True,
+        "verification_level": "professional"
+    },
+    {
+        "username": "euro_tuner",
+        "email": "euro@revsync.com",
+        "business_name": "European Precision Tuning",
+        "bio": "Expert in European motorcycle tuning and optimization",
+        "specialties": ["Ducati", "BMW", "Aprilia", "European bikes"],
+        "experience_years": 12,
+        "is_verified": True,
+        "verification_level": "expert"
+    },
+    {
+        "username": "track_specialist",
+        "email": "track@revsync.com",
+        "business_name": "Track Day Solutions",
+        "bio": "Track-focused tuning for maximum performance",
+        "specialties": ["Track tuning", "Racing", "Performance optimization"],
+        "experience_years": 10,
+        "is_verified": True,
+        "verification_level": "professional"
+    },
+    {
+        "username": "green_tuner",
+        "email": "green@revsync.com",
+        "business_name": "Eco Performance",
+        "bio": "Fuel economy focused tuning without sacrificing performance",
+        "specialties": ["Fuel economy", "Touring", "Commuter bikes"],
+        "experience_years": 6,
+        "is_verified": True,
+        "verification_level": "professional"
+    }
+])
+
+# creator, category, tune_type and safety_rating hold the natural key
+# (username / name / level) of the related row.
+TUNES_DATA = freeze_seed_rows([
+    {
+        "name": "Stage 1 Performance Flash",
+        "version": "2.1",
+        "description": "Professional stage 1 tune with optimized fuel and ignition maps for maximum power and torque gains while maintaining reliability.",
+        "short_description": "Stage 1 performance tune with +15HP, +10Nm gains",
+        "creator": "dyno_master",
+        "category": "performance",
+        "tune_type": "flash",
+        "safety_rating": "MEDIUM",
+        "power_gain_hp": 15,
+        "power_gain_percentage": Decimal("8.5"),
+        "torque_gain_nm": 10,
+        "torque_gain_percentage": Decimal("9.2"),
+        "fuel_economy_change_percentage": Decimal("-2.5"),
+        "price": Decimal("299.99"),
+        "tags": ["stage1", "performance", "street", "reliable"],
+        "dyno_tested": True,
+        "street_legal": True,
+        "status": "approved",
+        "is_featured": True
+    },
+    {
+        "name": "Track Day Special",
+        "version": "1.5",
+        "description": "Aggressive track-focused tune with raised rev limit, optimized for maximum performance on the track. Includes launch control and advanced traction settings.",
+        "short_description": "Track-only tune with +25HP, launch control, raised rev limit",
+        "creator": "track_specialist",
+        "category": "track",
+        "tune_type": "flash",
+        "safety_rating": "HIGH",
+        "power_gain_hp": 25,
+        "power_gain_percentage": Decimal("14.2"),
+        "torque_gain_nm": 18,
+        "torque_gain_percentage": Decimal("15.8"),
+        "rev_limit_change": 500,
+        "speed_limiter_removed": True,
+        "price": Decimal("499.99"),
+        "tags": ["track", "racing", "aggressive", "launch_control"],
+        "dyno_tested": True,
+        "street_legal": False,
+        "is_track_only": True,
+        "requires_premium_fuel": True,
+        "status": "approved",
+        "is_featured": True
+    },
+    {
+        "name": "Eco Touring Optimization",
+        "version": "1.2",
+        "description": "Fuel economy focused tune that optimizes combustion efficiency for long-distance touring while maintaining smooth power delivery.",
+        "short_description": "Eco-friendly tune with improved fuel economy and smooth power",
+        "creator": "green_tuner",
+        "category": "touring",
+        "tune_type": "flash",
+        "safety_rating": "LOW",
+        "power_gain_hp": 5,
+        "power_gain_percentage": Decimal("3.2"),
+        "torque_gain_nm": 8,
+        "torque_gain_percentage": Decimal("6.1"),
+        "fuel_economy_change_percentage": Decimal("12.5"),
+        "price": Decimal("199.99"),
+        "tags": ["eco", "touring", "fuel_economy", "smooth"],
+        "dyno_tested": True,
+        "street_legal": True,
+        "status": "approved"
+    },
+    {
+        "name": "Ducati V4 Race Flash",
+        "version": "3.0",
+        "description": "Specialized tune for Ducati V4 engines with Desmodronic valve optimization and advanced electronics integration.",
+        "short_description": "Ducati V4 specific race tune with desmo optimization",
+        "creator": "euro_tuner",
+        "category": "racing",
+        "tune_type": "flash",
+        "safety_rating": "CRITICAL",
+        "power_gain_hp": 35,
+        "power_gain_percentage": Decimal("18.5"),
+        "torque_gain_nm": 25,
+        "torque_gain_percentage": Decimal("20.2"),
+        "rev_limit_change": 750,
+        "speed_limiter_removed": True,
+        "price": Decimal("799.99"),
+        "tags": ["ducati", "v4", "racing", "desmo", "professional"],
+        "dyno_tested": True,
+        "street_legal": False,
+        "is_track_only": True,
+        "is_race_fuel_required": True,
+        "status": "approved",
+        "is_featured": True
+    },
+    {
+        "name": "QuickShifter Pro",
+        "version": "2.0",
+        "description": "Advanced quickshifter calibration for seamless gear changes with clutchless upshifts and downshifts.",
+        "short_description": "Professional quickshifter calibration for seamless shifts",
+        "creator": "speed_demon_tunes",
+        "category": "performance",
+        "tune_type": "ignition_map",
+        "safety_rating": "MEDIUM",
+        "power_gain_hp": 2,
+        "power_gain_percentage": Decimal("1.2"),
+        "price": Decimal("149.99"),
+        "tags": ["quickshift", "transmission", "smooth", "sport"],
+        "dyno_tested": False,
+        "street_legal": True,
+        "status": "approved"
+    }
+])
+
+COLLECTIONS_DATA = freeze_seed_rows([
+    {
+        "name": "Featured Performance Tunes",
+        "description": "Hand-picked performance tunes from verified creators",
+        "collection_type": "featured",
+        "is_featured": True,
+        "display_order": 1
+    },
+    {
+        "name": "Track Day Essentials",
+        "description": "Everything you need for track day domination",
+        "collection_type": "performance",
+        "is_featured": True,
+        "display_order": 2
+    },
+    {
+        "name": "Eco-Friendly Tunes",
+        "description": "Fuel-efficient tunes for conscious riders",
+        "collection_type": "category",
+        "is_featured": False,
+        "display_order": 3
+    }
+])
+
+
+def _copy_text(field, value):
+    """Render a prepared field value in PostgreSQL COPY text format"""
+    if value is None:
+        return r"\N"
+    if isinstance(field, models.JSONField):
+        value = json.dumps(value, cls=field.encoder)
+    elif isinstance(value, bool):
+        value = "t" if value else "f"
+    elif isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    else:
+        value = str(value)
+    return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def copy_seed_rows(model, objs):
+    """Insert unsaved instances with PostgreSQL COPY instead of INSERTs
+    
+    Auto-increment PKs are left to the database, so callers must re-read
+    the rows if they need ids. Conflicting rows are not skipped; filter
+    out existing keys first.
+    """
+    fields = [
+        field for field in model._meta.concrete_fields
+        if not isinstance(field, AutoFieldMixin)
     ]
+    # auto_now/auto_now_add columns get one timestamp for the whole batch
+    # instead of a pre_save() clock read per row.
+    now = timezone.now()
+    stamps = {
+        field: now if isinstance(field, models.DateTimeField) else timezone.localdate(now)
+        for field in fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+    }
+    buffer = io.StringIO()
+    for obj in objs:
+        values = []
+        for field in fields:
+            if field in stamps:
+                value = stamps[field]
+                setattr(obj, field.attname, value)
+            else:
+                value = field.pre_save(obj, add=True)
+            values.append(_copy_text(field, field.get_prep_value(value)))
+        buffer.write("\t".join(values))
+        buffer.write("\n")
+    buffer.seek(0)
     
-    manufacturers = []
-    for data in manufacturers_data:
-        manufacturer, created = Manufacturer.objects.get_or_create(
-            name=data["name"],
-            defaults=data
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) FROM STDIN",
+            buffer,
         )
-        manufacturers.append(manufacturer)
-        if created:
-            print(f"Created manufacturer: {manufacturer.name}")
+
+
+def upsert_seed_rows(model, rows, unique_field):
+    """Insert or update seed rows keyed on a unique field
+    
+    Issues INSERT ... ON CONFLICT (unique_field) DO UPDATE per batch, so
+    re-runs pick up edits to the seed data; rows with no other fields fall
+    back to ON CONFLICT DO NOTHING. Returns the saved instances in the same
+    order as ``rows``.
+    """
+    update_fields = sorted({field for row in rows for field in row} - {unique_field})
+    if update_fields:
+        conflict_options = {
+            "update_conflicts": True,
+            "unique_fields": [unique_field],
+            "update_fields": update_fields,
+        }
+    else:
+        conflict_options = {"ignore_conflicts": True}
+    model.objects.bulk_create(
+        [model(**row) for row in rows],
+        batch_size=BULK_BATCH_SIZE,
+        **conflict_options
+    )
+    logger.debug("Upserted %d %s rows", len(rows), model._meta.verbose_name)
     
-    return manufacturers
+    # PKs are not set on the instances after an upsert, so re-read them.
+    saved = model.objects.in_bulk([row[unique_field] for row in rows], field_name=unique_field)
+    return [saved[row[unique_field]] for row in rows]
+
+
+def create_manufacturers():
+    """Create motorcycle manufacturers"""
+    return upsert_seed_rows(Manufacturer, MANUFACTURERS_DATA, "name")
 
 
 def create_engine_types():
     """Create engine type configurations"""
-    engine_types_data = [
-        {"name": "Parallel Twin 270°", "configuration": "parallel_twin", "cooling_system": "liquid", "fuel_system": "fuel_injection"},
-        {"name": "Inline Four DOHC", "configuration": "inline_four", "cooling_system": "liquid", "fuel_system": "fuel_injection"},
-        {"name": "V-Twin 90° Desmo", "configuration": "v_twin", "cooling_system": "liquid", "fuel_system": "fuel_injection"},
-        {"name": "Single Cylinder SOHC", "configuration": "single", "cooling_system": "air", "fuel_system": "fuel_injection"},
-        {"name": "Inline Three Crossplane", "configuration": "inline_three", "cooling_system": "liquid", "fuel_system": "fuel_injection"},
-        {"name": "Boxer Twin", "configuration": "boxer", "cooling_system": "air", "fuel_system": "fuel_injection"},
-        {"name": "V-Four 90°", "configuration": "v_four", "cooling_system": "liquid", "fuel_system": "fuel_injection"},
-        {"name": "Inline Six", "configuration": "inline_six", "cooling_system": "liquid", "fuel_system": "fuel_injection"},
-        {"name": "V-Twin 45° Air-Cooled", "configuration": "v_twin", "cooling_system": "air", "fuel_system": "fuel_injection"},
-        {"name": "Single Cylinder Liquid", "configuration": "single", "cooling_system": "liquid", "fuel_system": "fuel_injection"},
-    ]
-    
-    engine_types = []
-    for data in engine_types_data:
-        engine_type, created = EngineType.objects.get_or_create(
-            name=data["name"],
-            defaults=data
-        )
-        engine_types.append(engine_type)
-        if created:
-            print(f"Created engine type: {engine_type.name}")
-    
-    return engine_types
+    return upsert_seed_rows(EngineType, ENGINE_TYPES_DATA, "name")
 
 
 def create_bike_categories():
     """Create motorcycle categories"""
-    categories = [
-        'sport', 'supersport', 'naked', 'touring', 'cruiser', 'adventure',
-        'dual_sport', 'dirt_bike', 'scooter', 'electric', 'cafe_racer'
-    ]
-    
-    bike_categories = []
-    for category in categories:
-        bike_category, created = BikeCategory.objects.get_or_create(name=category)
-        bike_categories.append(bike_category)
-        if created:
-            print(f"Created bike category: {bike_category.get_name_display()}")
-    
-    return bike_categories
+    return upsert_seed_rows(BikeCategory, [{"name": name} for name in BIKE_CATEGORIES], "name")
 
 
 def create_ecu_types():
     """Create ECU types for different motorcycles"""
-    ecu_types_data = [
-        {
-            "name": "ME17.9.21", "manufacturer": "Bosch", "version": "2.1",
-            "processor": "TriCore TC1782", "memory_kb": 2048, "flash_memory_kb": 4096,
-            "communication_protocol": "can", "supported_formats": ["bin", "hex"],
-            "is_tunable": True, "requires_cable": True
-        },
-        {
-            "name": "IAW-5AM", "manufacturer": "Magneti Marelli", "version": "1.0",
-            "processor": "ST10F269", "memory_kb": 1024, "flash_memory_kb": 2048,
-            "communication_protocol": "kline", "supported_formats": ["bin", "ecu"],
-            "is_tunable": True, "requires_cable": True
-        },
-        {
-            "name": "Synerject", "manufacturer": "Continental", "version": "3.2",
-            "processor": "MPC5554", "memory_kb": 1536, "flash_memory_kb": 3072,
-            "communication_protocol": "can", "supported_formats": ["bin", "hex", "map"],
-            "is_tunable": True, "requires_cable": False, "supports_obd": True
-        },
-        {
-            "name": "Keihin PGM-FI", "manufacturer": "Keihin", "version": "4.1",
-            "processor": "Renesas SH7058", "memory_kb": 512, "flash_memory_kb": 1024,
-            "communication_protocol": "kline", "supported_formats": ["bin"],
-            "is_tunable": True, "requires_cable": True
-        },
-        {
-            "name": "Mikuni EFI", "manufacturer": "Mikuni", "version": "2.0",
-            "processor": "Hitachi SH7055", "memory_kb": 768, "flash_memory_kb": 1536,
-            "communication_protocol": "can", "supported_formats": ["bin", "hex"],
-            "is_tunable": True, "requires_cable": True
-        },
-    ]
+    return upsert_seed_rows(ECUType, ECU_TYPES_DATA, "name")
+
+
+def _run_in_own_transaction(step):
+    """Run a seed step atomically, releasing the thread's DB connection after"""
+    try:
+        with transaction.atomic():
+            return step()
+    finally:
+        connections.close_all()
+
+
+def create_lookup_tables():
+    """Create the independent lookup tables (manufacturers, engine types,
+    bike categories and ECU types)
     
-    ecu_types = []
-    for data in ecu_types_data:
-        ecu_type, created = ECUType.objects.get_or_create(
-            name=data["name"],
-            manufacturer=data["manufacturer"],
-            defaults=data
-        )
-        ecu_types.append(ecu_type)
-        if created:
-            print(f"Created ECU type: {ecu_type}")
+    On PostgreSQL the steps run concurrently, each on its own thread-local
+    connection. SQLite serializes writers, so they run in order there.
+    """
+    steps = (create_manufacturers, create_engine_types, create_bike_categories, create_ecu_types)
+    if connection.vendor != "postgresql":
+        with transaction.atomic():
+            return [step() for step in steps]
     
-    return ecu_types
-
-
-def create_motorcycles(manufacturers, categories, engine_types):
-    """Create comprehensive motorcycle database"""
-    motorcycles_data = [
-        # Yamaha motorcycles
-        {
-            "manufacturer": "Yamaha", "model_name": "YZF-R1", "year": 2023, "category": "supersport",
-            "displacement_cc": 998, "cylinders": 4, "max_power_hp": 200, "max_torque_nm": 113,
-            "dry_weight_kg": 199, "seat_height_mm": 855, "fuel_capacity_liters": 17.0,
-            "top_speed_kmh": 299, "acceleration_0_100_seconds": 3.0, "msrp_usd": 17399,
-            "abs": True, "traction_control": True, "riding_modes": True, "quickshifter": True,
-            "description": "The ultimate supersport machine with MotoGP-derived technology"
-        },
-        {
-            "manufacturer": "Yamaha", "model_name": "MT-09", "year": 2023, "category": "naked",
-            "displacement_cc": 889, "cylinders": 3, "max_power_hp": 117, "max_torque_nm": 93,
-            "dry_weight_kg": 189, "seat_height_mm": 825, "fuel_capacity_liters": 14.0,
-            "top_speed_kmh": 241, "acceleration_0_100_seconds": 3.1, "msrp_usd": 9699,
-            "abs": True, "traction_control": True, "riding_modes": True,
-            "description": "Agile naked bike with crossplane triple engine"
-        },
-        {
-            "manufacturer": "Yamaha", "model_name": "Tenere 700", "year": 2023, "category": "adventure",
-            "displacement_cc": 689, "cylinders": 2, "max_power_hp": 72, "max_torque_nm": 68,
-            "dry_weight_kg": 205, "seat_height_mm": 880, "fuel_capacity_liters": 16.0,
-            "top_speed_kmh": 180, "msrp_usd": 10199,
-            "abs": True, "description": "Adventure touring bike built for exploration"
-        },
-        
-        # Honda motorcycles
-        {
-            "manufacturer": "Honda", "model_name": "CBR1000RR-R", "year": 2023, "category": "supersport",
-            "displacement_cc": 999, "cylinders": 4, "max_power_hp": 217, "max_torque_nm": 113,
-            "dry_weight_kg": 201, "seat_height_mm": 830, "fuel_capacity_liters": 16.1,
-            "top_speed_kmh": 299, "acceleration_0_100_seconds": 2.9, "msrp_usd": 28500,
-            "abs": True, "traction_control": True, "riding_modes": True, "quickshifter": True,
-            "description": "Honda's flagship superbike with RC213V-S derived technology"
-        },
-        {
-            "manufacturer": "Honda", "model_name": "CB650R", "year": 2023, "category": "naked",
-            "displacement_cc": 649, "cylinders": 4, "max_power_hp": 95, "max_torque_nm": 64,
-            "dry_weight_kg": 189, "seat_height_mm": 810, "fuel_capacity_liters": 15.4,
-            "top_speed_kmh": 200, "msrp_usd": 8999,
-            "abs": True, "description": "Neo-sports cafe with inline-four power"
-        },
-        
-        # Kawasaki motorcycles
-        {
-            "manufacturer": "Kawasaki", "model_name": "ZX-10R", "year": 2023, "category": "supersport",
-            "displacement_cc": 998, "cylinders": 4, "max_power_hp": 203, "max_torque_nm": 115,
-            "dry_weight_kg": 206, "seat_height_mm": 835, "fuel_capacity_liters": 17.0,
-            "top_speed_kmh": 299, "acceleration_0_100_seconds": 2.9, "msrp_usd": 16999,
-            "abs": True, "traction_control": True, "riding_modes": True, "quickshifter": True,
-            "description": "Track-focused superbike with advanced electronics"
-        },
-        {
-            "manufacturer": "Kawasaki", "model_name": "Z900", "year": 2023, "category": "naked",
-            "displacement_cc": 948, "cylinders": 4, "max_power_hp": 125, "max_torque_nm": 98,
-            "dry_weight_kg": 212, "seat_height_mm": 795, "fuel_capacity_liters": 17.0,
-            "top_speed_kmh": 230, "msrp_usd": 8999,
-            "abs": True, "traction_control": True, "description": "Refined naked with supernaked performance"
-        },
-        
-        # Ducati motorcycles
-        {
-            "manufacturer": "Ducati", "model_name": "Panigale V4S", "year": 2023, "category": "supersport",
-            "displacement_cc": 1103, "cylinders": 4, "max_power_hp": 214, "max_torque_nm": 124,
-            "dry_weight_kg": 195, "seat_height_mm": 830, "fuel_capacity_liters": 16.0,
-            "top_speed_kmh": 299, "acceleration_0_100_seconds": 2.8, "msrp_usd": 28395,
-            "abs": True, "traction_control": True, "riding_modes": True, "quickshifter": True,
-            "electronic_suspension": True, "description": "MotoGP-derived V4 superbike masterpiece"
-        },
-        {
-            "manufacturer": "Ducati", "model_name": "Monster 937", "year": 2023, "category": "naked",
-            "displacement_cc": 937, "cylinders": 2, "max_power_hp": 111, "max_torque_nm": 93,
-            "dry_weight_kg": 188, "seat_height_mm": 775, "fuel_capacity_liters": 14.0,
-            "top_speed_kmh": 225, "msrp_usd": 11995,
-            "abs": True, "traction_control": True, "riding_modes": True,
-            "description": "Iconic naked bike with Testastretta L-twin power"
-        },
-        
-        # BMW motorcycles
-        {
-            "manufacturer": "BMW", "model_name": "S1000RR", "year": 2023, "category": "supersport",
-            "displacement_cc": 999, "cylinders": 4, "max_power_hp": 205, "max_torque_nm": 113,
-            "dry_weight_kg": 197, "seat_height_mm": 824, "fuel_capacity_liters": 16.5,
-            "top_speed_kmh": 299, "acceleration_0_100_seconds": 2.9, "msrp_usd": 17295,
-            "abs": True, "traction_control": True, "riding_modes": True, "quickshifter": True,
-            "description": "German precision engineering in superbike form"
-        },
-        {
-            "manufacturer": "BMW", "model_name": "R1250GS", "year": 2023, "category": "adventure",
-            "displacement_cc": 1254, "cylinders": 2, "max_power_hp": 136, "max_torque_nm": 143,
-            "dry_weight_kg": 249, "seat_height_mm": 850, "fuel_capacity_liters": 20.0,
-            "top_speed_kmh": 200, "msrp_usd": 17295,
-            "abs": True, "traction_control": True, "riding_modes": True,
-            "description": "The ultimate adventure touring motorcycle"
-        },
-        
-        # KTM motorcycles
-        {
-            "manufacturer": "KTM", "model_name": "1290 Super Duke R", "year": 2023, "category": "naked",
-            "displacement_cc": 1301, "cylinders": 2, "max_power_hp": 180, "max_torque_nm": 140,
-            "dry_weight_kg": 189, "seat_height_mm": 835, "fuel_capacity_liters": 16.0,
-            "top_speed_kmh": 270, "acceleration_0_100_seconds": 2.8, "msrp_usd": 18999,
-            "abs": True, "traction_control": True, "riding_modes": True, "quickshifter": True,
-            "description": "The Beast - ultimate naked bike with LC8 V-twin power"
-        },
-        
-        # Harley-Davidson motorcycles
-        {
-            "manufacturer": "Harley-Davidson", "model_name": "Fat Bob", "year": 2023, "category": "cruiser",
-            "displacement_cc": 1868, "cylinders": 2, "max_power_hp": 93, "max_torque_nm": 155,
-            "dry_weight_kg": 299, "seat_height_mm": 675, "fuel_capacity_liters": 13.2,
-            "top_speed_kmh": 180, "msrp_usd": 18999,
-            "abs": True, "traction_control": True,
-            "description": "American cruiser with Milwaukee-Eight 114 power"
-        },
-        
-        # Electric motorcycles
-        {
-            "manufacturer": "Zero Motorcycles", "model_name": "SR/F", "year": 2023, "category": "electric",
-            "displacement_cc": 0, "cylinders": 0, "max_power_hp": 110, "max_torque_nm": 190,
-            "dry_weight_kg": 220, "seat_height_mm": 787, "fuel_capacity_liters": 0,
-            "top_speed_kmh": 200, "acceleration_0_100_seconds": 3.0, "msrp_usd": 19995,
-            "abs": True, "traction_control": True, "riding_modes": True,
-            "description": "Premium electric motorcycle with instant torque"
-        },
-    ]
+    with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+        futures = [executor.submit(_run_in_own_transaction, step) for step in steps]
+        return [future.result() for future in futures]
+
+
+@lru_cache(maxsize=None)
+def get_manufacturer_map():
+    """Manufacturers by name, loaded with one query and memoized per run"""
+    return Manufacturer.objects.in_bulk(field_name="name")
+
+
+@lru_cache(maxsize=None)
+def get_bike_category_map():
+    """Bike categories by name, loaded with one query and memoized per run"""
+    return BikeCategory.objects.in_bulk(field_name="name")
+
+
+def create_motorcycles(engine_types):
+    """Create comprehensive motorcycle database
     
-    motorcycles = []
-    category_map = {cat.name: cat for cat in categories}
-    manufacturer_map = {man.name: man for man in manufacturers}
+    Returns a dict mapping (manufacturer_id, model_name, year) to the
+    motorcycle id.
+    """
+    manufacturer_map = get_manufacturer_map()
+    category_map = get_bike_category_map()
     
-    for data in motorcycles_data:
-        manufacturer = manufacturer_map[data.pop("manufacturer")]
-        category = category_map[data.pop("category")]
-        
-        motorcycle, created = Motorcycle.objects.get_or_create(
-            manufacturer=manufacturer,
-            model_name=data["model_name"],
-            year=data["year"],
-            defaults={**data, "category": category}
+    keyed_rows = {}
+    for manufacturer_name, category_name, data in MOTORCYCLES_DATA:
+        manufacturer = manufacturer_map[manufacturer_name]
+        category = category_map[category_name]
+        keyed_rows[(manufacturer.id, data["model_name"], data["year"])] = (manufacturer, category, data)
+    model_names = {key[1] for key in keyed_rows}
+    
+    # Resolve which rows already exist with one SELECT, then insert the rest
+    # with one multi-row INSERT instead of a get_or_create per motorcycle.
+    existing = set(
+        Motorcycle.objects.filter(model_name__in=model_names).values_list(
+            "manufacturer_id", "model_name", "year"
         )
-        motorcycles.append(motorcycle)
-        if created:
-            print(f"Created motorcycle: {motorcycle}")
+    )
+    to_create = [
+        Motorcycle(manufacturer=manufacturer, category=category, **data)
+        for key, (manufacturer, category, data) in keyed_rows.items()
+        if key not in existing
+    ]
+    if connection.vendor == "postgresql":
+        copy_seed_rows(Motorcycle, to_create)
+    else:
+        Motorcycle.objects.bulk_create(to_create, batch_size=WIDE_BULK_BATCH_SIZE, ignore_conflicts=True)
+    logger.debug("Created %d motorcycles", len(to_create))
     
-    return motorcycles
+    # Nothing downstream traverses motorcycle relations, so re-read just the
+    # natural key and id rather than hydrating full model instances.
+    return {
+        (manufacturer_id, model_name, year): pk
+        for pk, manufacturer_id, model_name, year in Motorcycle.objects.filter(
+            model_name__in=model_names
+        ).values_list("id", "manufacturer_id", "model_name", "year")
+        if (manufacturer_id, model_name, year) in keyed_rows
+    }
 
 
 def create_tune_data():
     """Create tune-related data"""
     # Create tune categories
-    tune_categories = []
-    categories = ['performance', 'economy', 'racing', 'track', 'street', 'touring', 'custom']
-    for category in categories:
-        tune_category, created = TuneCategory.objects.get_or_create(name=category)
-        tune_categories.append(tune_category)
-        if created:
-            print(f"Created tune category: {tune_category}")
+    tune_categories = upsert_seed_rows(
+        TuneCategory, [{"name": name} for name in TUNE_CATEGORIES], "name"
+    )
     
     # Create tune types
-    tune_types = []
-    types = ['flash', 'piggyback', 'fuel_controller', 'ignition_map', 'full_system']
-    for tune_type in types:
-        tune_type_obj, created = TuneType.objects.get_or_create(name=tune_type)
-        tune_types.append(tune_type_obj)
-        if created:
-            print(f"Created tune type: {tune_type_obj}")
+    tune_types = upsert_seed_rows(TuneType, [{"name": name} for name in TUNE_TYPES], "name")
     
     # Create safety ratings
-    safety_ratings_data = [
-        {
-            "level": "LOW",
-            "description": "Minimal risk with conservative tuning parameters",
-            "color_code": "#28a745",
-            "warning_text": "This tune has been tested and verified safe for street use.",
-            "requires_consent": False,
-            "max_downloads": 5
-        },
-        {
-            "level": "MEDIUM",
-            "description": "Moderate risk with enhanced performance parameters",
-            "color_code": "#ffc107",
-            "warning_text": "This tune modifies engine parameters. Use with caution.",
-            "requires_consent": True,
-            "max_downloads": 3
-        },
-        {
-            "level": "HIGH",
-            "description": "High risk with aggressive tuning for experienced users",
-            "color_code": "#fd7e14",
-            "warning_text": "This tune significantly modifies engine behavior. Professional installation recommended.",
-            "requires_consent": True,
-            "max_downloads": 2
-        },
-        {
-            "level": "CRITICAL",
-            "description": "Extreme modifications for track use only",
-            "color_code": "#dc3545",
-            "warning_text": "WARNING: Track use only. May void warranty and damage engine.",
-            "requires_consent": True,
-            "max_downloads": 1
-        }
-    ]
-    
-    safety_ratings = []
-    for data in safety_ratings_data:
-        safety_rating, created = SafetyRating.objects.get_or_create(
-            level=data["level"],
-            defaults=data
-        )
-        safety_ratings.append(safety_rating)
-        if created:
-            print(f"Created safety rating: {safety_rating}")
+    safety_ratings = upsert_seed_rows(SafetyRating, SAFETY_RATINGS_DATA, "level")
     
     return tune_categories, tune_types, safety_ratings
 
 
 def create_tune_creators():
     """Create sample tune creators"""
-    creators_data = [
-        {
-            "username": "dyno_master",
-            "email": "dyno@revsync.com",
-            "business_name": "DynoMaster Tuning",
-            "bio": "Professional motorcycle tuner with 15+ years experience",
-            "specialties": ["Sport bikes", "Track tuning", "Dyno testing"],
-            "experience_years": 15,
-            "is_verified": True,
-            "verification_level": "expert"
-        },
-        {
-            "username": "speed_demon_tunes",
-            "email": "speed@revsync.com",
-            "business_name": "Speed Demon Performance",
-            "bio": "Specializing in maximum performance street tunes",
-            "specialties": ["Street performance", "Yamaha", "Kawasaki"],
-            "experience_years": 8,
-            "is_verified": True,
-            "verification_level": "professional"
-        },
-        {
-            "username": "euro_tuner",
-            "email": "euro@revsync.com",
-            "business_name": "European Precision Tuning",
-            "bio": "Expert in European motorcycle tuning and optimization",
-            "specialties": ["Ducati", "BMW", "Aprilia", "European bikes"],
-            "experience_years": 12,
-            "is_verified": True,
-            "verification_level": "expert"
-        },
-        {
-            "username": "track_specialist",
-            "email": "track@revsync.com",
-            "business_name": "Track Day Solutions",
-            "bio": "Track-focused tuning for maximum performance",
-            "specialties": ["Track tuning", "Racing", "Performance optimization"],
-            "experience_years": 10,
-            "is_verified": True,
-            "verification_level": "professional"
-        },
-        {
-            "username": "green_tuner",
-            "email": "green@revsync.com",
-            "business_name": "Eco Performance",
-            "bio": "Fuel economy focused tuning without sacrificing performance",
-            "specialties": ["Fuel economy", "Touring", "Commuter bikes"],
-            "experience_years": 6,
-            "is_verified": True,
-            "verification_level": "professional"
-        }
-    ]
+    # Two multi-row INSERTs (users, then creator profiles) instead of a pair
+    # of get_or_create calls per creator; re-runs skip existing rows.
+    usernames = [data["username"] for data in CREATORS_DATA]
+    User.objects.bulk_create(
+        [
+            User(username=data["username"], email=data["email"], password=DEFAULT_PASSWORD_HASH)
+            for data in CREATORS_DATA
+        ],
+        batch_size=BULK_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    user_map = User.objects.in_bulk(usernames, field_name="username")
     
-    creators = []
-    for data in creators_data:
-        user_data = {
-            "username": data["username"],
-            "email": data["email"],
-            "password": "defaultpass123"
-        }
-        
-        user, created = User.objects.get_or_create(
-            username=data["username"],
-            defaults=user_data
-        )
-        
-        if created:
-            user.set_password("defaultpass123")
-            user.save()
-        
-        creator_data = {k: v for k, v in data.items() if k not in ["username", "email"]}
-        creator, created = TuneCreator.objects.get_or_create(
-            user=user,
-            defaults=creator_data
+    existing_user_ids = set(
+        TuneCreator.objects.filter(user__in=user_map.values()).values_list("user_id", flat=True)
+    )
+    to_create = [
+        TuneCreator(
+            user=user_map[data["username"]],
+            **{k: v for k, v in data.items() if k not in ("username", "email")}
         )
-        creators.append(creator)
-        if created:
-            print(f"Created tune creator: {creator}")
+        for data in CREATORS_DATA
+        if user_map[data["username"]].id not in existing_user_ids
+    ]
+    TuneCreator.objects.bulk_create(to_create, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
+    logger.debug("Created %d tune creators", len(to_create))
+    
+    creators_by_user = {
+        creator.user_id: creator
+        for creator in TuneCreator.objects.select_related("user").filter(user__in=user_map.values())
+    }
+    creators = [creators_by_user[user_map[username].id] for username in usernames]
     
     return creators
 
 
 def create_sample_tunes(creators, tune_categories, tune_types, safety_ratings, motorcycles):
     """Create sample tunes"""
-    tunes_data = [
-        {
-            "name": "Stage 1 Performance Flash",
-            "version": "2.1",
-            "description": "Professional stage 1 tune with optimized fuel and ignition maps for maximum power and torque gains while maintaining reliability.",
-            "short_description": "Stage 1 performance tune with +15HP, +10Nm gains",
-            "creator": creators[0],  # dyno_master
-            "category": tune_categories[0],  # performance
-            "tune_type": tune_types[0],  # flash
-            "safety_rating": safety_ratings[1],  # MEDIUM
-            "power_gain_hp": 15,
-            "power_gain_percentage": Decimal("8.5"),
-            "torque_gain_nm": 10,
-            "torque_gain_percentage": Decimal("9.2"),
-            "fuel_economy_change_percentage": Decimal("-2.5"),
-            "price": Decimal("299.99"),
-            "tags": ["stage1", "performance", "street", "reliable"],
-            "dyno_tested": True,
-            "street_legal": True,
-            "status": "approved",
-            "is_featured": True
-        },
-        {
-            "name": "Track Day Special",
-            "version": "1.5",
-            "description": "Aggressive track-focused tune with raised rev limit, optimized for maximum performance on the track. Includes launch control and advanced traction settings.",
-            "short_description": "Track-only tune with +25HP, launch control, raised rev limit",
-            "creator": creators[3],  # track_specialist
-            "category": tune_categories[3],  # track
-            "tune_type": tune_types[0],  # flash
-            "safety_rating": safety_ratings[2],  # HIGH
-            "power_gain_hp": 25,
-            "power_gain_percentage": Decimal("14.2"),
-            "torque_gain_nm": 18,
-            "torque_gain_percentage": Decimal("15.8"),
-            "rev_limit_change": 500,
-            "speed_limiter_removed": True,
-            "price": Decimal("499.99"),
-            "tags": ["track", "racing", "aggressive", "launch_control"],
-            "dyno_tested": True,
-            "street_legal": False,
-            "is_track_only": True,
-            "requires_premium_fuel": True,
-            "status": "approved",
-            "is_featured": True
-        },
-        {
-            "name": "Eco Touring Optimization",
-            "version": "1.2",
-            "description": "Fuel economy focused tune that optimizes combustion efficiency for long-distance touring while maintaining smooth power delivery.",
-            "short_description": "Eco-friendly tune with improved fuel economy and smooth power",
-            "creator": creators[4],  # green_tuner
-            "category": tune_categories[5],  # touring
-            "tune_type": tune_types[0],  # flash
-            "safety_rating": safety_ratings[0],  # LOW
-            "power_gain_hp": 5,
-            "power_gain_percentage": Decimal("3.2"),
-            "torque_gain_nm": 8,
-            "torque_gain_percentage": Decimal("6.1"),
-            "fuel_economy_change_percentage": Decimal("12.5"),
-            "price": Decimal("199.99"),
-            "tags": ["eco", "touring", "fuel_economy", "smooth"],
-            "dyno_tested": True,
-            "street_legal": True,
-            "status": "approved"
-        },
-        {
-            "name": "Ducati V4 Race Flash",
-            "version": "3.0",
-            "description": "Specialized tune for Ducati V4 engines with Desmodronic valve optimization and advanced electronics integration.",
-            "short_description": "Ducati V4 specific race tune with desmo optimization",
-            "creator": creators[2],  # euro_tuner
-            "category": tune_categories[2],  # racing
-            "tune_type": tune_types[0],  # flash
-            "safety_rating": safety_ratings[3],  # CRITICAL
-            "power_gain_hp": 35,
-            "power_gain_percentage": Decimal("18.5"),
-            "torque_gain_nm": 25,
-            "torque_gain_percentage": Decimal("20.2"),
-            "rev_limit_change": 750,
-            "speed_limiter_removed": True,
-            "price": Decimal("799.99"),
-            "tags": ["ducati", "v4", "racing", "desmo", "professional"],
-            "dyno_tested": True,
-            "street_legal": False,
-            "is_track_only": True,
-            "is_race_fuel_required": True,
-            "status": "approved",
-            "is_featured": True
-        },
-        {
-            "name": "QuickShifter Pro",
-            "version": "2.0",
-            "description": "Advanced quickshifter calibration for seamless gear changes with clutchless upshifts and downshifts.",
-            "short_description": "Professional quickshifter calibration for seamless shifts",
-            "creator": creators[1],  # speed_demon_tunes
-            "category": tune_categories[0],  # performance
-            "tune_type": tune_types[3],  # ignition_map
-            "safety_rating": safety_ratings[1],  # MEDIUM
-            "power_gain_hp": 2,
-            "power_gain_percentage": Decimal("1.2"),
-            "price": Decimal("149.99"),
-            "tags": ["quickshift", "transmission", "smooth", "sport"],
-            "dyno_tested": False,
-            "street_legal": True,
-            "status": "approved"
-        }
-    ]
+    creator_map = {creator.user.username: creator for creator in creators}
+    category_map = {category.name: category for category in tune_categories}
+    tune_type_map = {tune_type.name: tune_type for tune_type in tune_types}
+    safety_rating_map = {rating.level: rating for rating in safety_ratings}
     
-    tunes = []
-    for data in tunes_data:
-        # Set published date for approved tunes
-        if data.get("status") == "approved":
-            data["published_at"] = datetime.now() - timedelta(days=random.randint(1, 30))
-        
-        tune, created = Tune.objects.get_or_create(
-            name=data["name"],
-            creator=data["creator"],
-            defaults=data
+    # Tune has no unique constraint on (name, creator), so look up existing
+    # rows first and insert only the missing ones in one bulk_create. UUID
+    # PKs are generated client-side, so new instances already carry their ids.
+    existing = {
+        (tune.name, tune.creator_id): tune
+        for tune in Tune.objects.filter(
+            creator__in=creators, name__in=[data["name"] for data in TUNES_DATA]
         )
+    }
+    tunes = []
+    to_create = []
+    for data in TUNES_DATA:
+        creator = creator_map[data["creator"]]
+        tune = existing.get((data["name"], creator.id))
+        if tune is None:
+            tune = Tune(**{
+                **data,
+                "creator": creator,
+                "category": category_map[data["category"]],
+                "tune_type": tune_type_map[data["tune_type"]],
+                "safety_rating": safety_rating_map[data["safety_rating"]],
+            })
+            to_create.append(tune)
         tunes.append(tune)
-        if created:
-            print(f"Created tune: {tune}")
+    Tune.objects.bulk_create(to_create, batch_size=BULK_BATCH_SIZE)
+    logger.debug("Created %d tunes", len(to_create))
+    
+    # Set published dates for approved tunes in one UPDATE pass rather than
+    # baking a per-row random value into each insert.
+    now = timezone.now()
+    unpublished = [t for t in tunes if t.status == "approved" and t.published_at is None]
+    for tune in unpublished:
+        tune.published_at = now - timedelta(days=random.randint(1, 30))
+    Tune.objects.bulk_update(unpublished, ["published_at"], batch_size=BULK_BATCH_SIZE)
     
-    return tunes
+    # Re-read with the FKs joined so downstream code can traverse
+    # creator/category/safety_rating without a query per tune.
+    tunes_by_pk = Tune.objects.select_related(
+        "creator__user", "category", "safety_rating"
+    ).in_bulk([tune.pk for tune in tunes])
+    return [tunes_by_pk[tune.pk] for tune in tunes]
 
 
-def create_tune_collections(tunes):
+def create_tune_collections():
     """Create featured tune collections"""
     # Create a staff user for collections
     staff_user, created = User.objects.get_or_create(
@@ -594,131 +625,149 @@ def create_tune_collections(tunes):
         defaults={
             "email": "admin@revsync.com",
             "is_staff": True,
-            "is_superuser": True
+            "is_superuser": True,
+            "password": ADMIN_PASSWORD_HASH
         }
     )
-    if created:
-        staff_user.set_password("admin123")
-        staff_user.save()
     
-    collections_data = [
-        {
-            "name": "Featured Performance Tunes",
-            "description": "Hand-picked performance tunes from verified creators",
-            "collection_type": "featured",
-            "is_featured": True,
-            "display_order": 1
-        },
-        {
-            "name": "Track Day Essentials",
-            "description": "Everything you need for track day domination",
-            "collection_type": "performance",
-            "is_featured": True,
-            "display_order": 2
-        },
-        {
-            "name": "Eco-Friendly Tunes",
-            "description": "Fuel-efficient tunes for conscious riders",
-            "collection_type": "category",
-            "is_featured": False,
-            "display_order": 3
-        }
-    ]
-    
-    collections = []
-    for data in collections_data:
-        collection, created = TuneCollection.objects.get_or_create(
-            name=data["name"],
-            defaults={**data, "created_by": staff_user}
+    existing = {
+        collection.name: collection
+        for collection in TuneCollection.objects.filter(
+            name__in=[data["name"] for data in COLLECTIONS_DATA]
         )
-        collections.append(collection)
-        if created:
-            print(f"Created tune collection: {collection}")
-    
-    # Add tunes to collections
-    featured_tunes = [t for t in tunes if t.is_featured]
-    track_tunes = [t for t in tunes if t.is_track_only]
-    eco_tunes = [t for t in tunes if "eco" in t.tags]
+    }
+    to_create = [
+        TuneCollection(**data, created_by=staff_user)
+        for data in COLLECTIONS_DATA
+        if data["name"] not in existing
+    ]
+    TuneCollection.objects.bulk_create(to_create, batch_size=BULK_BATCH_SIZE)
+    logger.debug("Created %d tune collections", len(to_create))
     
-    # Add to Featured Performance Tunes
-    for i, tune in enumerate(featured_tunes[:3]):
-        TuneCollectionItem.objects.get_or_create(
-            collection=collections[0],
-            tune=tune,
-            defaults={"order": i + 1}
+    # bulk_create only sets PKs on backends that support RETURNING, so
+    # re-read the collections to get their ids.
+    collections_by_name = {
+        collection.name: collection
+        for collection in TuneCollection.objects.filter(
+            name__in=[data["name"] for data in COLLECTIONS_DATA]
         )
+    }
+    collections = [collections_by_name[data["name"]] for data in COLLECTIONS_DATA]
     
-    # Add to Track Day Essentials
-    for i, tune in enumerate(track_tunes[:2]):
-        TuneCollectionItem.objects.get_or_create(
-            collection=collections[1],
-            tune=tune,
-            defaults={"order": i + 1}
-        )
+    # Pick each collection's tunes with indexed DB filters; only the ids are
+    # needed to link them.
+    tune_ids = Tune.objects.values_list("id", flat=True)
+    featured_tune_ids = list(tune_ids.filter(is_featured=True)[:3])
+    track_tune_ids = list(tune_ids.filter(is_track_only=True)[:2])
+    if connection.features.supports_json_field_contains:
+        eco_tune_ids = list(tune_ids.filter(tags__contains=["eco"])[:2])
+    else:
+        # SQLite has no JSON containment lookup
+        eco_tune_ids = [
+            tune.id for tune in Tune.objects.only("id", "tags") if "eco" in tune.tags
+        ][:2]
     
-    # Add to Eco-Friendly Tunes
-    for i, tune in enumerate(eco_tunes[:2]):
-        TuneCollectionItem.objects.get_or_create(
-            collection=collections[2],
-            tune=tune,
-            defaults={"order": i + 1}
+    # Add tunes to all three collections with a single multi-row INSERT;
+    # ignore_conflicts keeps re-runs idempotent via unique_together.
+    items = [
+        TuneCollectionItem(collection=collection, tune_id=tune_id, order=i + 1)
+        for collection, collection_tune_ids in (
+            (collections[0], featured_tune_ids),
+            (collections[1], track_tune_ids),
+            (collections[2], eco_tune_ids),
         )
+        for i, tune_id in enumerate(collection_tune_ids)
+    ]
+    TuneCollectionItem.objects.bulk_create(items, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
     
     return collections
 
 
-def main():
+def main(argv=None):
     """Main population function"""
-    print("Starting database population...")
+    args = sys.argv[1:] if argv is None else argv
+    force = "--force" in args or bool(os.environ.get("REVSYNC_FORCE_SEED"))
+    if not force and Motorcycle.objects.exists() and Tune.objects.exists():
+        logger.info("Database already populated, skipping (pass --force to re-run)")
+        return
+    
+    if "--from-fixtures" in args:
+        # The fixture is generated locally, not committed
+        if not os.path.exists(SEED_FIXTURE):
+            logger.error(
+                "Seed fixture %s not found. Seed a database without --from-fixtures, "
+                "then run dump_seed.py to create it.", SEED_FIXTURE
+            )
+            return 1
+        # loaddata inserts the dumped rows directly, skipping the lookups
+        # and conflict handling the create_* steps need.
+        logger.info("Loading seed data from %s...", SEED_FIXTURE)
+        try:
+            call_command("loaddata", SEED_FIXTURE, verbosity=0)
+        except Exception:
+            logger.exception("Error loading seed fixture")
+            return 1
+        return
+    
+    logger.info("Starting database population...")
     
     try:
         # Create basic data
-        print("\n1. Creating manufacturers...")
-        manufacturers = create_manufacturers()
-        
-        print("\n2. Creating engine types...")
-        engine_types = create_engine_types()
-        
-        print("\n3. Creating bike categories...")
-        categories = create_bike_categories()
-        
-        print("\n4. Creating ECU types...")
-        ecu_types = create_ecu_types()
+        logger.info("1-4. Creating manufacturers, engine types, bike categories and ECU types...")
+        manufacturers, engine_types, categories, ecu_types = create_lookup_tables()
         
-        print("\n5. Creating motorcycles...")
-        motorcycles = create_motorcycles(manufacturers, categories, engine_types)
+        # A single transaction means one commit for the rest of the seed
+        # instead of one per get_or_create, and a clean rollback on failure.
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL synchronous_commit = OFF")
+            
+            logger.info("5. Creating motorcycles...")
+            motorcycles = create_motorcycles(engine_types)
         
-        print("\n6. Creating tune data...")
-        tune_categories, tune_types, safety_ratings = create_tune_data()
+            logger.info("6. Creating tune data...")
+            tune_categories, tune_types, safety_ratings = create_tune_data()
         
-        print("\n7. Creating tune creators...")
-        creators = create_tune_creators()
+            logger.info("7. Creating tune creators...")
+            creators = create_tune_creators()
         
-        print("\n8. Creating sample tunes...")
-        tunes = create_sample_tunes(creators, tune_categories, tune_types, safety_ratings, motorcycles)
+            logger.info("8. Creating sample tunes...")
+            tunes = create_sample_tunes(creators, tune_categories, tune_types, safety_ratings, motorcycles)
         
-        print("\n9. Creating tune collections...")
-        collections = create_tune_collections(tunes)
+            logger.info("9. Creating tune collections...")
+            collections = create_tune_collections()
         
-        print(f"\nDatabase population complete!")
-        print(f"Created:")
-        print(f"  - {len(manufacturers)} manufacturers")
-        print(f"  - {len(engine_types)} engine types")
-        print(f"  - {len(categories)} bike categories")
-        print(f"  - {len(ecu_types)} ECU types")
-        print(f"  - {len(motorcycles)} motorcycles")
-        print(f"  - {len(tune_categories)} tune categories")
-        print(f"  - {len(tune_types)} tune types")
-        print(f"  - {len(safety_ratings)} safety ratings")
-        print(f"  - {len(creators)} tune creators")
-        print(f"  - {len(tunes)} tunes")
-        print(f"  - {len(collections)} tune collections")
+            # One record (and one write) for the whole summary
+            logger.info(
+                "Database population complete!\n"
+                "Created:\n"
+                "  - %d manufacturers\n"
+                "  - %d engine types\n"
+                "  - %d bike categories\n"
+                "  - %d ECU types\n"
+                "  - %d motorcycles\n"
+                "  - %d tune categories\n"
+                "  - %d tune types\n"
+                "  - %d safety ratings\n"
+                "  - %d tune creators\n"
+                "  - %d tunes\n"
+                "  - %d tune collections",
+                len(manufacturers), len(engine_types), len(categories), len(ecu_types),
+                len(motorcycles), len(tune_categories), len(tune_types), len(safety_ratings),
+                len(creators), len(tunes), len(collections),
+            )
         
-    except Exception as e:
-        print(f"Error during population: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error during population")
+        # Non-zero exit so CI and wrapper scripts see the failure
+        return 1
+    finally:
+        # Don't leak instances into later runs against a different database
+        get_manufacturer_map.cache_clear()
+        get_bike_category_map.cache_clear()
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    sys.exit(main()) 
\ No newline at end of file
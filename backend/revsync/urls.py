@@ -1,7 +1,6 @@
 from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
-from django.conf.urls.static import static
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -20,7 +19,9 @@ urlpatterns = [
     # path('api/community/', include('community.urls')),
 ]
 
-# Serve media files in development
+# Serve media files in development. The static() helper is only imported
+# here so production workers never load it.
 if settings.DEBUG:
+    from django.conf.urls.static import static
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT) 
\ No newline at end of file
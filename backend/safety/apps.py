@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class SafetyConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'safety'
+    verbose_name = 'RevSync Safety'
+
+    def ready(self):
+        # Registers the cache invalidation signal receivers
+        from . import cache  # noqa: F401
@@ -0,0 +1,101 @@
+"""
+Caches for rarely changing safety lookups
+"""
+
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db.models import Count
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import SafetyIncident, TuneValidation
+
+# Validations without an expires_at are still only cached this long
+TUNE_VALIDATION_CACHE_TTL = 3600  # seconds
+
+# Validator output for an unchanged tune file and safety profile
+VALIDATION_RESULT_CACHE_TTL = 3600  # seconds
+
+# Dashboard incident-type breakdown; a few minutes behind is fine
+INCIDENT_TYPE_SUMMARY_CACHE_TTL = 300  # seconds
+
+# Opt-in audit log totals; paging clients re-request them on every page
+AUDIT_LOG_COUNT_CACHE_TTL = 60  # seconds
+
+
+def _tune_validation_cache_key(tune_file_id) -> str:
+    return f"tune_validation:{tune_file_id}"
+
+
+def get_cached_tune_validation(tune_file_id):
+    """Serialized passed validation for a tune file, or None on a miss"""
+    return cache.get(_tune_validation_cache_key(tune_file_id))
+
+
+def cache_tune_validation(validation: TuneValidation, data) -> None:
+    """Cache a passed validation's serialized data until it expires"""
+    timeout = TUNE_VALIDATION_CACHE_TTL
+    if validation.expires_at:
+        remaining = (validation.expires_at - timezone.now()).total_seconds()
+        timeout = max(0, min(timeout, int(remaining)))
+    cache.set(_tune_validation_cache_key(validation.tune_file_id), dict(data), timeout=timeout)
+
+
+# Connected from SafetyConfig.ready()
+@receiver(post_save, sender=TuneValidation)
+def _invalidate_failed_tune_validation(sender, instance, **kwargs):
+    if instance.status != 'PASSED':
+        cache.delete(_tune_validation_cache_key(instance.tune_file_id))
+
+
+@receiver(post_delete, sender=TuneValidation)
+def _invalidate_deleted_tune_validation(sender, instance, **kwargs):
+    cache.delete(_tune_validation_cache_key(instance.tune_file_id))
+
+
+def get_or_compute_validation_result(tune_file, safety_profile, compute):
+    """Return the validator result for this tune file revision, computing it once
+
+    The key covers the tune file's and the profile's updated_at, so editing
+    either one produces a fresh key instead of needing an explicit delete.
+    ``safety_profile`` should come from services.get_safety_profile(), the
+    same versioned cache the validator reads its limits from.
+    """
+    key = (
+        f"vres:{tune_file.id}:{tune_file.updated_at.timestamp():.6f}:"
+        f"{safety_profile.category}:{safety_profile.updated_at.timestamp():.6f}"
+    )
+    return cache.get_or_set(key, compute, timeout=VALIDATION_RESULT_CACHE_TTL)
+
+
+def get_top_incident_types(days: int = 30):
+    """Five most frequent incident types over the last ``days``, cached briefly
+
+    The GROUP BY runs at most once per TTL instead of on every dashboard load.
+    """
+    def summarize():
+        since = timezone.now() - timedelta(days=days)
+        return list(
+            SafetyIncident.objects.filter(created_at__gte=since)
+            .values('incident_type')
+            .annotate(count=Count('id'))
+            .order_by('-count')[:5]
+        )
+    
+    return cache.get_or_set(
+        f"incident_type_top5:{days}d", summarize, timeout=INCIDENT_TYPE_SUMMARY_CACHE_TTL
+    )
+
+
+def count_audit_logs(queryset, filters: dict) -> int:
+    """Filtered audit log count, shared for a minute across identical filters
+
+    ``filters`` must describe everything ``queryset`` was filtered on, since
+    it alone determines the cache key.
+    """
+    key = 'audit_log_count:' + '|'.join(
+        f"{name}={filters[name] or ''}" for name in sorted(filters)
+    )
+    return cache.get_or_set(key, queryset.count, timeout=AUDIT_LOG_COUNT_CACHE_TTL)
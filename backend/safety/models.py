@@ -53,6 +53,33 @@ class SafetyProfile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    class Meta:
+        # Keep the limits internally consistent at the database level
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(rpm_warning_threshold__lt=models.F('max_rpm')),
+                name='safety_profile_rpm_ordering',
+            ),
+            models.CheckConstraint(
+                check=models.Q(min_afr__lte=models.F('afr_warning_lean'))
+                & models.Q(afr_warning_lean__lt=models.F('afr_warning_rich'))
+                & models.Q(afr_warning_rich__lte=models.F('max_afr')),
+                name='safety_profile_afr_ordering',
+            ),
+            models.CheckConstraint(
+                check=models.Q(min_ignition_advance__lt=models.F('max_ignition_advance')),
+                name='safety_profile_ignition_ordering',
+            ),
+            models.CheckConstraint(
+                check=models.Q(max_boost_psi__gte=0) & models.Q(max_fuel_pressure_psi__gt=0),
+                name='safety_profile_pressure_positive',
+            ),
+            models.CheckConstraint(
+                check=models.Q(max_engine_load_percent__gt=0, max_engine_load_percent__lte=100),
+                name='safety_profile_load_percent_range',
+            ),
+        ]
+    
     def __str__(self):
         return f"{self.name} ({self.category})"
 
@@ -118,6 +145,11 @@ class TuneValidation(models.Model):
     
     class Meta:
         ordering = ['-validated_at']
+        indexes = [
+            models.Index(fields=['tune_file', '-validated_at']),
+            models.Index(fields=['status', '-validated_at']),
+            models.Index(fields=['risk_level']),
+        ]
     
     def __str__(self):
         return f"Validation for {self.tune_file.name} - {self.status}"
@@ -150,15 +182,8 @@ class FlashSession(models.Model):
     current_stage = models.CharField(max_length=20, choices=FLASH_STAGES, default='PREPARING')
     progress_percentage = models.IntegerField(default=0)
     
-    # Safety data
+    # Safety data (ECU snapshots and process logs live in FlashSessionDetail)
     pre_flash_backup_url = models.URLField(blank=True)
-    pre_flash_ecu_data = models.JSONField(default=dict)
-    post_flash_ecu_data = models.JSONField(default=dict)
-    
-    # Process details
-    flash_logs = models.JSONField(default=list)
-    error_messages = models.JSONField(default=list)
-    warnings = models.JSONField(default=list)
     
     # Safety checks
     user_confirmed_safety = models.BooleanField(default=False)
@@ -177,9 +202,44 @@ class FlashSession(models.Model):
     
     class Meta:
         ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['user', '-started_at']),
+            models.Index(fields=['current_stage', '-started_at']),
+        ]
     
     def __str__(self):
         return f"Flash Session {self.id} - {self.current_stage}"
+    
+    @property
+    def duration_minutes(self):
+        """Session duration in minutes, rounded to one decimal"""
+        if self.duration_seconds:
+            return round(self.duration_seconds / 60, 1)
+        return None
+
+
+class FlashSessionDetail(models.Model):
+    """Bulky JSON payloads for a flash session
+    
+    Kept out of FlashSession so list queries don't drag ECU snapshots and
+    process logs off disk for every row.
+    """
+    
+    session = models.OneToOneField(
+        FlashSession, on_delete=models.CASCADE, primary_key=True, related_name='detail'
+    )
+    
+    # Safety data
+    pre_flash_ecu_data = models.JSONField(default=dict)
+    post_flash_ecu_data = models.JSONField(default=dict)
+    
+    # Process details
+    flash_logs = models.JSONField(default=list)
+    error_messages = models.JSONField(default=list)
+    warnings = models.JSONField(default=list)
+    
+    def __str__(self):
+        return f"Flash Session Detail {self.session_id}"
 
 
 class UserSafetyConsent(models.Model):
@@ -206,6 +266,7 @@ class UserSafetyConsent(models.Model):
     
     # Legal tracking
     consent_version = models.CharField(max_length=10, default='1.0')
+    consent_text_hash = models.CharField(max_length=64, blank=True)  # SHA-256 of consent_text
     consented_at = models.DateTimeField(auto_now_add=True)
     expires_at = models.DateTimeField(null=True, blank=True)
     revoked_at = models.DateTimeField(null=True, blank=True)
@@ -218,6 +279,9 @@ class UserSafetyConsent(models.Model):
     class Meta:
         unique_together = ['user', 'consent_type', 'consent_version']
         ordering = ['-consented_at']
+        indexes = [
+            models.Index(fields=['user', 'consent_type']),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.consent_type}"
@@ -244,7 +308,10 @@ class SafetyIncident(models.Model):
         ('CRITICAL', 'Critical - Safety Risk'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Sequential internal key keeps the PK index small and inserts append-only;
+    # public_id is what the API exposes.
+    id = models.BigAutoField(primary_key=True)
+    public_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
     reporter = models.ForeignKey(User, on_delete=models.CASCADE)
     incident_type = models.CharField(max_length=30, choices=INCIDENT_TYPES)
     severity = models.CharField(max_length=20, choices=SEVERITY_LEVELS)
@@ -281,6 +348,17 @@ class SafetyIncident(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['severity', '-created_at']),
+            models.Index(fields=['tune_file']),
+            # Open incidents are a small slice of the table; the dashboard
+            # counts unresolved critical ones on every load
+            models.Index(
+                fields=['severity'],
+                condition=models.Q(resolved_at__isnull=True),
+                name='safety_incident_open_severity',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.incident_type} - {self.severity} - {self.title}"
@@ -302,7 +380,10 @@ class SafetyAuditLog(models.Model):
         ('EXPERT_REVIEW', 'Expert Review Conducted'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Sequential internal key keeps the PK index small and inserts append-only;
+    # public_id is what the API exposes.
+    id = models.BigAutoField(primary_key=True)
+    public_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, null=True)
     action_type = models.CharField(max_length=30, choices=ACTION_TYPES)
     
@@ -326,6 +407,8 @@ class SafetyAuditLog(models.Model):
         indexes = [
             models.Index(fields=['action_type', '-timestamp']),
             models.Index(fields=['user', '-timestamp']),
+            # Keyset pagination in SafetyAuditView walks this index
+            models.Index(fields=['-timestamp', '-public_id']),
         ]
     
     def __str__(self):
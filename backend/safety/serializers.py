@@ -8,6 +8,22 @@ from .models import (
 from .services import ValidationResult
 
 
+class ChoiceLabelField(serializers.Field):
+    """Read-only human label for a choice value
+    
+    Equivalent to source='get_FOO_display', but the labels are built into a
+    dict once per field instead of scanning the choices on every row.
+    """
+    
+    def __init__(self, choices, **kwargs):
+        self.labels = dict(choices)
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+    
+    def to_representation(self, value):
+        return self.labels.get(value, value)
+
+
 class SafetyProfileSerializer(serializers.ModelSerializer):
     """Serializer for safety profiles"""
     
@@ -48,42 +64,48 @@ class TuneValidationSerializer(serializers.ModelSerializer):
             'id', 'validator', 'validated_at', 'tune_file_name',
             'validator_username', 'safety_profile_name'
         ]
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the FKs read by the nested name fields"""
+        return queryset.select_related('tune_file', 'safety_profile', 'validator')
 
 
 class FlashSessionSerializer(serializers.ModelSerializer):
     """Serializer for flash sessions"""
     
     user_username = serializers.CharField(source='user.username', read_only=True)
-    motorcycle_info = serializers.SerializerMethodField()
+    motorcycle_make = serializers.CharField(source='motorcycle.make', read_only=True)
+    motorcycle_model = serializers.CharField(source='motorcycle.model', read_only=True)
+    motorcycle_year = serializers.IntegerField(source='motorcycle.year', read_only=True)
     tune_file_info = serializers.SerializerMethodField()
-    duration_minutes = serializers.SerializerMethodField()
+    duration_minutes = serializers.FloatField(read_only=True)
     
     class Meta:
         model = FlashSession
         fields = [
-            'id', 'user', 'user_username', 'motorcycle', 'motorcycle_info',
-            'tune_purchase', 'tune_file', 'tune_file_info',
+            'id', 'user', 'user_username', 'motorcycle', 'motorcycle_make',
+            'motorcycle_model', 'motorcycle_year', 'tune_purchase', 'tune_file', 'tune_file_info',
             'current_stage', 'progress_percentage',
-            'pre_flash_backup_url', 'pre_flash_ecu_data', 'post_flash_ecu_data',
-            'flash_logs', 'error_messages', 'warnings',
+            'pre_flash_backup_url',
             'user_confirmed_safety', 'bike_in_safe_mode', 
             'backup_verified', 'post_flash_verified',
             'started_at', 'completed_at', 'duration_seconds', 'duration_minutes',
             'recovery_attempted', 'recovery_successful'
         ]
         read_only_fields = [
-            'id', 'user', 'user_username', 'motorcycle_info', 'tune_file_info',
-            'duration_minutes', 'started_at'
+            'id', 'user', 'user_username', 'motorcycle_make', 'motorcycle_model',
+            'motorcycle_year', 'tune_file_info', 'duration_minutes', 'started_at'
         ]
     
-    def get_motorcycle_info(self, obj):
-        """Get motorcycle information"""
-        return {
-            'make': obj.motorcycle.make,
-            'model': obj.motorcycle.model,
-            'year': obj.motorcycle.year,
-            'display_name': f"{obj.motorcycle.make} {obj.motorcycle.model} {obj.motorcycle.year}"
-        }
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the FKs read by user_username, motorcycle_* and tune_file_info
+        
+        Querysets serialized with many=True must go through this, otherwise
+        every row issues its own SELECTs for motorcycle and tune_file.
+        """
+        return queryset.select_related('user', 'motorcycle', 'tune_file', 'tune_purchase')
     
     def get_tune_file_info(self, obj):
         """Get tune file information"""
@@ -92,41 +114,56 @@ class FlashSessionSerializer(serializers.ModelSerializer):
             'version': getattr(obj.tune_file, 'version', '1.0'),
             'file_size': getattr(obj.tune_file, 'file_size', 0),
         }
+
+
+class FlashSessionDetailSerializer(FlashSessionSerializer):
+    """Flash session plus ECU snapshots and process logs, for single-session responses"""
+    
+    pre_flash_ecu_data = serializers.JSONField(source='detail.pre_flash_ecu_data', read_only=True)
+    post_flash_ecu_data = serializers.JSONField(source='detail.post_flash_ecu_data', read_only=True)
+    flash_logs = serializers.JSONField(source='detail.flash_logs', read_only=True)
+    error_messages = serializers.JSONField(source='detail.error_messages', read_only=True)
+    warnings = serializers.JSONField(source='detail.warnings', read_only=True)
+    
+    class Meta(FlashSessionSerializer.Meta):
+        fields = FlashSessionSerializer.Meta.fields + [
+            'pre_flash_ecu_data', 'post_flash_ecu_data',
+            'flash_logs', 'error_messages', 'warnings'
+        ]
     
-    def get_duration_minutes(self, obj):
-        """Get session duration in minutes"""
-        if obj.duration_seconds:
-            return round(obj.duration_seconds / 60, 1)
-        return None
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return super().setup_eager_loading(queryset).select_related('detail')
 
 
 class SafetyConsentSerializer(serializers.ModelSerializer):
     """Serializer for safety consents"""
     
     user_username = serializers.CharField(source='user.username', read_only=True)
-    consent_type_display = serializers.CharField(source='get_consent_type_display', read_only=True)
+    consent_type_display = ChoiceLabelField(UserSafetyConsent.CONSENT_TYPES, source='consent_type')
     
     class Meta:
         model = UserSafetyConsent
         fields = [
             'id', 'user', 'user_username', 'consent_type', 'consent_type_display',
             'consent_text', 'user_ip_address', 'user_agent',
-            'consent_version', 'consented_at', 'expires_at', 'revoked_at',
+            'consent_version', 'consent_text_hash', 'consented_at', 'expires_at', 'revoked_at',
             'motorcycle', 'tune_file', 'flash_session'
         ]
         read_only_fields = [
             'id', 'user', 'user_username', 'consent_type_display',
-            'consented_at', 'user_ip_address', 'user_agent'
+            'consent_text_hash', 'consented_at', 'user_ip_address', 'user_agent'
         ]
 
 
 class SafetyIncidentSerializer(serializers.ModelSerializer):
     """Serializer for safety incidents"""
     
+    id = serializers.UUIDField(source='public_id', read_only=True)
     reporter_username = serializers.CharField(source='reporter.username', read_only=True)
     investigator_username = serializers.CharField(source='investigated_by.username', read_only=True)
-    incident_type_display = serializers.CharField(source='get_incident_type_display', read_only=True)
-    severity_display = serializers.CharField(source='get_severity_display', read_only=True)
+    incident_type_display = ChoiceLabelField(SafetyIncident.INCIDENT_TYPES, source='incident_type')
+    severity_display = ChoiceLabelField(SafetyIncident.SEVERITY_LEVELS, source='severity')
     
     class Meta:
         model = SafetyIncident
@@ -144,13 +181,77 @@ class SafetyIncidentSerializer(serializers.ModelSerializer):
             'severity_display', 'investigated_by', 'investigator_username',
             'created_at', 'updated_at'
         ]
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the FKs read by the *_username fields and related ids"""
+        return queryset.select_related(
+            'reporter', 'investigated_by', 'flash_session', 'tune_file', 'motorcycle'
+        )
+
+
+class SafetyIncidentListSerializer(SafetyIncidentSerializer):
+    """Incident rows for list responses, without the captured log/state blobs"""
+    
+    DEFERRED_FIELDS = ('error_logs', 'system_state', 'user_actions')
+    
+    class Meta(SafetyIncidentSerializer.Meta):
+        fields = [
+            field for field in SafetyIncidentSerializer.Meta.fields
+            if field not in ('error_logs', 'system_state', 'user_actions')
+        ]
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return super().setup_eager_loading(queryset).defer(*cls.DEFERRED_FIELDS)
+    
+    @classmethod
+    def _column_renderers(cls):
+        """(response key, values() lookup, renderer) for every readable field
+        
+        Derived from the bound fields' sources, so it follows Meta.fields.
+        Related fields render as their primary key, so they read the FK's
+        *_id column and need no renderer.
+        """
+        renderers = []
+        for key, field in cls().fields.items():
+            if field.write_only:
+                continue
+            if isinstance(field, serializers.RelatedField):
+                column = cls.Meta.model._meta.get_field(field.source).attname
+                renderers.append((key, column, None))
+            else:
+                renderers.append((key, '__'.join(field.source_attrs), field.to_representation))
+        return renderers
+    
+    @classmethod
+    def values_queryset(cls, queryset):
+        """Plain-dict rows holding only the columns list_rows() reads"""
+        return queryset.values(*dict.fromkeys(lookup for _, lookup, _ in cls._column_renderers()))
+    
+    @classmethod
+    def list_rows(cls, rows):
+        """Render values_queryset() rows the way this serializer renders instances
+        
+        Each field's own to_representation runs on the raw column, skipping
+        the per-row serializer and model construction.
+        """
+        renderers = cls._column_renderers()
+        return [
+            {
+                key: row[lookup] if render is None or row[lookup] is None else render(row[lookup])
+                for key, lookup, render in renderers
+            }
+            for row in rows
+        ]
 
 
 class SafetyAuditLogSerializer(serializers.ModelSerializer):
     """Serializer for safety audit logs"""
     
+    id = serializers.UUIDField(source='public_id', read_only=True)
     user_username = serializers.CharField(source='user.username', read_only=True)
-    action_type_display = serializers.CharField(source='get_action_type_display', read_only=True)
+    action_type_display = ChoiceLabelField(SafetyAuditLog.ACTION_TYPES, source='action_type')
     
     class Meta:
         model = SafetyAuditLog
@@ -260,19 +361,7 @@ class BackupCreationSerializer(serializers.Serializer):
 class FlashProgressUpdateSerializer(serializers.Serializer):
     """Serializer for flash progress updates"""
     
-    stage = serializers.ChoiceField(choices=[
-        ('PREPARING', 'Preparing Flash'),
-        ('BACKING_UP', 'Creating Backup'),
-        ('VALIDATING', 'Validating Tune'),
-        ('PRE_CHECKS', 'Pre-Flash Safety Checks'),
-        ('FLASHING', 'Flashing ECU'),
-        ('VERIFYING', 'Verifying Flash'),
-        ('POST_CHECKS', 'Post-Flash Verification'),
-        ('COMPLETED', 'Flash Completed'),
-        ('FAILED', 'Flash Failed'),
-        ('RESTORING', 'Restoring Backup'),
-        ('RESTORED', 'Backup Restored'),
-    ])
+    stage = serializers.ChoiceField(choices=FlashSession.FLASH_STAGES)
     progress = serializers.IntegerField(min_value=0, max_value=100, required=False)
     data = serializers.DictField(required=False)
 
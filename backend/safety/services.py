@@ -1,20 +1,141 @@
 from typing import Dict, List, Optional, Tuple, Any
 from django.utils import timezone
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import Count, Max
+from django.db.models.expressions import RawSQL
 from decimal import Decimal
 import hashlib
-import json
 import logging
+import math
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import orjson
 
 from .models import (
-    SafetyProfile, TuneValidation, FlashSession, 
+    SafetyProfile, TuneValidation, FlashSession, FlashSessionDetail,
     UserSafetyConsent, SafetyIncident, SafetyAuditLog
 )
 
 logger = logging.getLogger(__name__)
 
+# SafetyProfile columns the validator reads. Decimal limits are cast to
+# float once at load time so validation loops don't convert per map cell.
+SAFETY_PROFILE_FIELDS = (
+    'category', 'max_rpm', 'rpm_warning_threshold',
+    'min_afr', 'max_afr', 'afr_warning_lean', 'afr_warning_rich',
+    'max_ignition_advance', 'min_ignition_advance',
+    'max_boost_psi', 'max_coolant_temp_c', 'max_egt_temp_c',
+    'requires_expert_review',
+)
+
+
+def _flagged_positions(values: List[float], low: float, high: float):
+    """Positions in a 1-D map whose value is below ``low``, above ``high`` or not finite
+    
+    The comparison runs vectorized in NumPy so the per-cell checks only see
+    cells that are actually out of band. None cells become NaN in the array,
+    which fails both comparisons, so non-finite cells are flagged explicitly.
+    Maps with any non-numeric cell, including numeric strings NumPy would
+    otherwise convert, fall back to every position so the caller reports
+    each such cell as invalid.
+    """
+    if not all(isinstance(v, (int, float, Decimal)) for v in values):
+        return range(len(values))
+    try:
+        array = np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return range(len(values))
+    if array.ndim != 1:
+        return range(len(values))
+    return np.flatnonzero((array < low) | (array > high) | ~np.isfinite(array)).tolist()
+
+
+def _is_finite_number(value) -> bool:
+    """Whether a map cell is a real, finite number the band checks can compare"""
+    return isinstance(value, (int, float, Decimal)) and math.isfinite(value)
+
+# Violation wording that marks a tune as CRITICAL rather than HIGH risk
+CRITICAL_VIOLATION_RE = re.compile(r'dangerously|exceeds safe maximum|corrupted', re.IGNORECASE)
+
+# Tunes at least this large are hashed on _CHECKSUM_EXECUTOR, overlapping
+# the hash with the Python-side validation layers.
+PARALLEL_CHECKSUM_MIN_BYTES = 1024 * 1024
+_CHECKSUM_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1), thread_name_prefix='tune-checksum'
+)
+
+# Per-cell map messages. Printf-style templates are cheaper to apply than
+# the equivalent f-strings when a bad map flags hundreds of cells. Every
+# placeholder is %s, and profile limits are filled from limits['display'],
+# so the text matches str() of the model values (e.g. "11.50" for a
+# two-place DecimalField) rather than the float used for comparisons.
+AFR_LEAN_VIOLATION = "AFR value %s at position %s is dangerously lean (minimum: %s)"
+AFR_RICH_VIOLATION = "AFR value %s at position %s is too rich (maximum: %s)"
+AFR_LEAN_WARNING = "AFR value %s at position %s is approaching lean limit"
+AFR_RICH_WARNING = "AFR value %s at position %s is approaching rich limit"
+IGNITION_ADVANCE_VIOLATION = "Ignition advance %s° at position %s exceeds safe maximum %s°"
+IGNITION_RETARD_VIOLATION = "Ignition retard %s° at position %s exceeds safe minimum %s°"
+INVALID_MAP_VALUE_VIOLATION = "%s value %r at position %s is not a valid number - map may be corrupted"
+
+# A run of this many null bytes inside a tune usually means a truncated or
+# zero-filled dump rather than real map data.
+NULL_RUN_SIGNATURE = bytes(1024)
+
+
+@lru_cache(maxsize=1)
+def _load_safety_profiles(version: Tuple) -> Tuple[Dict[str, SafetyProfile], Dict[str, Dict[str, Any]]]:
+    """Safety profiles by bike category, memoized per profile-table version
+    
+    Returns the SafetyProfile instances (for views that serialize or link
+    them) and the validator's limit dicts, both built from the same rows so
+    they can never disagree. Everything returned is shared between
+    requests and must not be mutated.
+    """
+    instances = {profile.category: profile for profile in SafetyProfile.objects.all()}
+    limits = {}
+    for category, profile in instances.items():
+        values = {field: getattr(profile, field) for field in SAFETY_PROFILE_FIELDS}
+        limits[category] = {
+            field: float(value) if isinstance(value, Decimal) else value
+            for field, value in values.items()
+        }
+        # Limits as the model renders them, for violation messages
+        limits[category]['display'] = {field: str(value) for field, value in values.items()}
+    return instances, limits
+
+
+def _current_safety_profiles() -> Tuple[Dict[str, SafetyProfile], Dict[str, Dict[str, Any]]]:
+    """Cached profiles for the current table version
+    
+    The version is (row count, latest updated_at) from one aggregate query,
+    so every worker process notices edits made elsewhere, which a
+    post_save signal on its own would not.
+    """
+    version = SafetyProfile.objects.aggregate(count=Count('id'), updated=Max('updated_at'))
+    return _load_safety_profiles((version['count'], version['updated']))
+
+
+def get_safety_profiles() -> Dict[str, Dict[str, Any]]:
+    """Return the cached safety profile limits, reloading them when the table changes"""
+    return _current_safety_profiles()[1]
+
+
+def get_safety_profile(category: str) -> SafetyProfile:
+    """Return the cached SafetyProfile for a bike category
+    
+    Raises SafetyProfile.DoesNotExist like a plain .get(). The instance is
+    shared and must not be modified.
+    """
+    try:
+        return _current_safety_profiles()[0][category]
+    except KeyError:
+        raise SafetyProfile.DoesNotExist(f'No safety profile for category: {category}')
+
 
 @dataclass
 class ValidationResult:
@@ -32,15 +153,16 @@ class ValidationResult:
 class ComprehensiveTuneValidator:
     """Comprehensive tune validation service with multi-layer safety checks"""
     
-    def __init__(self):
-        self.safety_profiles = self._load_safety_profiles()
-    
-    def _load_safety_profiles(self) -> Dict[str, SafetyProfile]:
-        """Load safety profiles for different bike categories"""
-        profiles = {}
-        for profile in SafetyProfile.objects.all():
-            profiles[profile.category] = profile
-        return profiles
+    @property
+    def safety_profiles(self) -> Dict[str, Dict[str, Any]]:
+        """Profile limits by bike category, looked up on use
+        
+        Not held on the instance: validators are long-lived module-level
+        singletons in the views, and get_safety_profiles() already caches
+        per table version. Services that never validate (e.g. SafeFlashService
+        in the flash progress views) don't query the profile table.
+        """
+        return get_safety_profiles()
     
     def validate_tune(
         self, 
@@ -57,7 +179,8 @@ class ComprehensiveTuneValidator:
             bike_category: Motorcycle category for safety limits
         
         Returns:
-            ValidationResult with detailed safety analysis
+            ValidationResult with detailed safety analysis. If the checksum
+            fails, only the checksum layer is reported.
         """
         violations = []
         warnings = []
@@ -78,38 +201,48 @@ class ComprehensiveTuneValidator:
                 parameter_check_passed=False
             )
         
-        # 1. File Integrity Check
-        checksum_result = self._validate_checksum(tune_file_data, tune_metadata)
-        validation_data['checksum'] = checksum_result
-        
-        if not checksum_result['valid']:
-            violations.append("File integrity check failed - tune may be corrupted")
+        # 1. File Integrity Check. Large files are hashed on a worker thread
+        # (hashlib releases the GIL) while the metadata layers run here.
+        checksum_future = None
+        checksum_result = None
+        if len(tune_file_data) >= PARALLEL_CHECKSUM_MIN_BYTES:
+            checksum_future = _CHECKSUM_EXECUTOR.submit(
+                self._validate_checksum, tune_file_data, tune_metadata
+            )
+        else:
+            checksum_result = self._validate_checksum(tune_file_data, tune_metadata)
+            if not checksum_result['valid']:
+                return self._integrity_failure(checksum_result)
         
         # 2. Parameter Safety Validation
         param_result = self._validate_parameters(tune_metadata, safety_profile)
-        validation_data['parameters'] = param_result
-        
-        violations.extend(param_result['violations'])
-        warnings.extend(param_result['warnings'])
         
         # 3. ECU Compatibility Check
         ecu_result = self._validate_ecu_compatibility(tune_metadata)
-        validation_data['ecu_compatibility'] = ecu_result
-        
-        if not ecu_result['compatible']:
-            violations.append("ECU compatibility check failed")
         
         # 4. Map Structure Validation
         map_result = self._validate_map_structure(tune_file_data, tune_metadata)
-        validation_data['map_structure'] = map_result
-        
-        violations.extend(map_result['violations'])
-        warnings.extend(map_result['warnings'])
         
         # 5. Performance Claims Validation
         performance_result = self._validate_performance_claims(tune_metadata)
+        
+        if checksum_future is not None:
+            checksum_result = checksum_future.result()
+            if not checksum_result['valid']:
+                return self._integrity_failure(checksum_result)
+        
+        validation_data['checksum'] = checksum_result
+        validation_data['parameters'] = param_result
+        validation_data['ecu_compatibility'] = ecu_result
+        validation_data['map_structure'] = map_result
         validation_data['performance'] = performance_result
         
+        violations.extend(param_result['violations'])
+        warnings.extend(param_result['warnings'])
+        if not ecu_result['compatible']:
+            violations.append("ECU compatibility check failed")
+        violations.extend(map_result['violations'])
+        warnings.extend(map_result['warnings'])
         warnings.extend(performance_result['warnings'])
         
         # Determine risk level and requirements
@@ -131,6 +264,23 @@ class ComprehensiveTuneValidator:
             parameter_check_passed=len(param_result['violations']) == 0
         )
     
+    def _integrity_failure(self, checksum_result: Dict) -> ValidationResult:
+        """Result for a tune whose checksum doesn't match
+        
+        A corrupted file is CRITICAL whatever else it contains, so the other
+        layers' findings are not reported.
+        """
+        return ValidationResult(
+            is_safe=False,
+            risk_level='CRITICAL',
+            violations=["File integrity check failed - tune may be corrupted"],
+            warnings=[],
+            validation_data={'checksum': checksum_result},
+            requires_expert_review=True,
+            checksum_valid=False,
+            parameter_check_passed=False
+        )
+    
     def _validate_checksum(self, tune_data: bytes, metadata: Dict) -> Dict:
         """Validate file integrity using checksum"""
         calculated_checksum = hashlib.sha256(tune_data).hexdigest()
@@ -143,52 +293,17 @@ class ComprehensiveTuneValidator:
             'algorithm': 'sha256'
         }
     
-    def _validate_parameters(self, metadata: Dict, safety_profile: SafetyProfile) -> Dict:
+    def _validate_parameters(self, metadata: Dict, safety_profile: Dict[str, Any]) -> Dict:
         """Validate tune parameters against safety limits"""
         violations = []
         warnings = []
         
-        # RPM Validation
-        if 'max_rpm' in metadata:
-            max_rpm = metadata['max_rpm']
-            if max_rpm > safety_profile.max_rpm:
-                violations.append(
-                    f"RPM limit {max_rpm} exceeds safe maximum {safety_profile.max_rpm}"
-                )
-            elif max_rpm > safety_profile.rpm_warning_threshold:
-                warnings.append(
-                    f"RPM limit {max_rpm} is above recommended threshold"
-                )
-        
-        # Air/Fuel Ratio Validation
-        if 'afr_map' in metadata:
-            afr_violations, afr_warnings = self._validate_afr_map(
-                metadata['afr_map'], safety_profile
-            )
-            violations.extend(afr_violations)
-            warnings.extend(afr_warnings)
-        
-        # Ignition Timing Validation
-        if 'ignition_map' in metadata:
-            ignition_violations = self._validate_ignition_timing(
-                metadata['ignition_map'], safety_profile
-            )
-            violations.extend(ignition_violations)
-        
-        # Boost Pressure Validation
-        if 'boost_pressure' in metadata:
-            boost = metadata['boost_pressure']
-            if boost > float(safety_profile.max_boost_psi):
-                violations.append(
-                    f"Boost pressure {boost} PSI exceeds safe maximum {safety_profile.max_boost_psi} PSI"
-                )
-        
-        # Temperature Limit Validation
-        if 'temperature_limits' in metadata:
-            temp_violations = self._validate_temperature_limits(
-                metadata['temperature_limits'], safety_profile
-            )
-            violations.extend(temp_violations)
+        # Only the validators whose key is present run, in table order
+        for key, validator in self._PARAMETER_VALIDATORS:
+            if key in metadata:
+                param_violations, param_warnings = validator(self, metadata[key], safety_profile)
+                violations.extend(param_violations)
+                warnings.extend(param_warnings)
         
         return {
             'violations': violations,
@@ -196,64 +311,91 @@ class ComprehensiveTuneValidator:
             'parameters_checked': len(metadata.keys())
         }
     
-    def _validate_afr_map(self, afr_map: List[float], safety_profile: SafetyProfile) -> Tuple[List[str], List[str]]:
+    def _validate_rpm_limit(self, max_rpm: int, limits: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+        """Validate the tune's RPM limit"""
+        if max_rpm > limits['max_rpm']:
+            return [f"RPM limit {max_rpm} exceeds safe maximum {limits['max_rpm']}"], []
+        if max_rpm > limits['rpm_warning_threshold']:
+            return [], [f"RPM limit {max_rpm} is above recommended threshold"]
+        return [], []
+    
+    def _validate_afr_map(self, afr_map: List[float], limits: Dict[str, float]) -> Tuple[List[str], List[str]]:
         """Validate air/fuel ratio map values"""
         violations = []
         warnings = []
-        
-        for i, afr in enumerate(afr_map):
-            if afr < float(safety_profile.min_afr):
-                violations.append(
-                    f"AFR value {afr} at position {i} is dangerously lean (minimum: {safety_profile.min_afr})"
-                )
-            elif afr > float(safety_profile.max_afr):
-                violations.append(
-                    f"AFR value {afr} at position {i} is too rich (maximum: {safety_profile.max_afr})"
-                )
-            elif afr < float(safety_profile.afr_warning_lean):
-                warnings.append(
-                    f"AFR value {afr} at position {i} is approaching lean limit"
-                )
-            elif afr > float(safety_profile.afr_warning_rich):
-                warnings.append(
-                    f"AFR value {afr} at position {i} is approaching rich limit"
-                )
+        min_afr = limits['min_afr']
+        max_afr = limits['max_afr']
+        warning_lean = limits['afr_warning_lean']
+        warning_rich = limits['afr_warning_rich']
+        
+        display = limits['display']
+        
+        for i in _flagged_positions(afr_map, max(min_afr, warning_lean), min(max_afr, warning_rich)):
+            afr = afr_map[i]
+            if not _is_finite_number(afr):
+                violations.append(INVALID_MAP_VALUE_VIOLATION % ('AFR', afr, i))
+            elif afr < min_afr:
+                violations.append(AFR_LEAN_VIOLATION % (afr, i, display['min_afr']))
+            elif afr > max_afr:
+                violations.append(AFR_RICH_VIOLATION % (afr, i, display['max_afr']))
+            elif afr < warning_lean:
+                warnings.append(AFR_LEAN_WARNING % (afr, i))
+            elif afr > warning_rich:
+                warnings.append(AFR_RICH_WARNING % (afr, i))
         
         return violations, warnings
     
-    def _validate_ignition_timing(self, ignition_map: List[float], safety_profile: SafetyProfile) -> List[str]:
+    def _validate_ignition_timing(self, ignition_map: List[float], limits: Dict[str, float]) -> Tuple[List[str], List[str]]:
         """Validate ignition timing values"""
         violations = []
-        
-        for i, timing in enumerate(ignition_map):
-            if timing > safety_profile.max_ignition_advance:
-                violations.append(
-                    f"Ignition advance {timing}° at position {i} exceeds safe maximum {safety_profile.max_ignition_advance}°"
-                )
-            elif timing < safety_profile.min_ignition_advance:
-                violations.append(
-                    f"Ignition retard {timing}° at position {i} exceeds safe minimum {safety_profile.min_ignition_advance}°"
-                )
-        
-        return violations
+        max_advance = limits['max_ignition_advance']
+        min_advance = limits['min_ignition_advance']
+        display = limits['display']
+        
+        for i in _flagged_positions(ignition_map, min_advance, max_advance):
+            timing = ignition_map[i]
+            if not _is_finite_number(timing):
+                violations.append(INVALID_MAP_VALUE_VIOLATION % ('Ignition timing', timing, i))
+            elif timing > max_advance:
+                violations.append(IGNITION_ADVANCE_VIOLATION % (timing, i, display['max_ignition_advance']))
+            elif timing < min_advance:
+                violations.append(IGNITION_RETARD_VIOLATION % (timing, i, display['min_ignition_advance']))
+        
+        return violations, []
+    
+    def _validate_boost_pressure(self, boost: float, limits: Dict[str, float]) -> Tuple[List[str], List[str]]:
+        """Validate boost pressure"""
+        if boost > limits['max_boost_psi']:
+            return [f"Boost pressure {boost} PSI exceeds safe maximum {limits['max_boost_psi']} PSI"], []
+        return [], []
     
-    def _validate_temperature_limits(self, temp_limits: Dict, safety_profile: SafetyProfile) -> List[str]:
+    def _validate_temperature_limits(self, temp_limits: Dict, limits: Dict[str, float]) -> Tuple[List[str], List[str]]:
         """Validate temperature limit settings"""
         violations = []
         
         if 'coolant_temp' in temp_limits:
-            if temp_limits['coolant_temp'] > safety_profile.max_coolant_temp_c:
+            if temp_limits['coolant_temp'] > limits['max_coolant_temp_c']:
                 violations.append(
                     f"Coolant temperature limit {temp_limits['coolant_temp']}°C exceeds safe maximum"
                 )
         
         if 'egt_temp' in temp_limits:
-            if temp_limits['egt_temp'] > safety_profile.max_egt_temp_c:
+            if temp_limits['egt_temp'] > limits['max_egt_temp_c']:
                 violations.append(
                     f"EGT temperature limit {temp_limits['egt_temp']}°C exceeds safe maximum"
                 )
         
-        return violations
+        return violations, []
+    
+    # Metadata key -> parameter validator, in reporting order. Each validator
+    # takes (value, profile limits) and returns (violations, warnings).
+    _PARAMETER_VALIDATORS = (
+        ('max_rpm', _validate_rpm_limit),
+        ('afr_map', _validate_afr_map),
+        ('ignition_map', _validate_ignition_timing),
+        ('boost_pressure', _validate_boost_pressure),
+        ('temperature_limits', _validate_temperature_limits),
+    )
     
     def _validate_ecu_compatibility(self, metadata: Dict) -> Dict:
         """Validate ECU compatibility"""
@@ -289,6 +431,13 @@ class ComprehensiveTuneValidator:
         if tune_data[:4] == b'\x00\x00\x00\x00':
             violations.append("File appears to be corrupted (null header)")
         
+        # bytes.find runs the substring search in C over the whole buffer
+        null_run_offset = tune_data.find(NULL_RUN_SIGNATURE, 4)
+        if null_run_offset != -1:
+            warnings.append(
+                f"File contains a run of {len(NULL_RUN_SIGNATURE)}+ null bytes at offset {null_run_offset}"
+            )
+        
         return {
             'violations': violations,
             'warnings': warnings,
@@ -321,8 +470,7 @@ class ComprehensiveTuneValidator:
         """Calculate overall risk level"""
         if violations:
             # Critical violations
-            critical_keywords = ['dangerously', 'exceeds safe maximum', 'corrupted']
-            if any(keyword in violation.lower() for violation in violations for keyword in critical_keywords):
+            if any(CRITICAL_VIOLATION_RE.search(violation) for violation in violations):
                 return 'CRITICAL'
             return 'HIGH'
         
@@ -337,12 +485,12 @@ class ComprehensiveTuneValidator:
         
         return 'MINIMAL'
     
-    def _requires_expert_review(self, risk_level: str, metadata: Dict, safety_profile: SafetyProfile) -> bool:
+    def _requires_expert_review(self, risk_level: str, metadata: Dict, safety_profile: Dict[str, Any]) -> bool:
         """Determine if expert review is required"""
         if risk_level in ['HIGH', 'CRITICAL']:
             return True
         
-        if safety_profile.requires_expert_review:
+        if safety_profile['requires_expert_review']:
             return True
         
         if metadata.get('expert_tune', False):
@@ -378,6 +526,7 @@ class SafeFlashService:
             tune_purchase=purchase,
             current_stage='PREPARING'
         )
+        session.detail = FlashSessionDetail.objects.create(session=session)
         
         # Log session initiation
         SafetyAuditLog.objects.create(
@@ -396,6 +545,14 @@ class SafeFlashService:
         
         return session
     
+    def _get_detail(self, session: FlashSession) -> FlashSessionDetail:
+        """Return the session's log/snapshot row, creating it for older sessions"""
+        try:
+            return session.detail
+        except FlashSessionDetail.DoesNotExist:
+            session.detail = FlashSessionDetail.objects.create(session=session)
+            return session.detail
+    
     def update_flash_progress(
         self, 
         session: FlashSession, 
@@ -415,48 +572,81 @@ class SafeFlashService:
             'progress': progress or session.progress_percentage,
             'data': data or {}
         }
-        session.flash_logs.append(log_entry)
-        session.save()
+        session.save(update_fields=['current_stage', 'progress_percentage'])
+        self._append_detail_entry(session, 'flash_logs', log_entry)
     
-    def create_backup(self, session: FlashSession, backup_data: bytes) -> bool:
-        """Create and verify ECU backup"""
+    def _append_detail_entry(self, session: FlashSession, field: str, entry: Any):
+        """Append an entry to one of the session detail's JSON lists
+        
+        On PostgreSQL the append happens server-side (jsonb ||), so the
+        growing list isn't re-sent on every tick and concurrent appends
+        don't overwrite each other. Other backends re-save the list.
+        """
+        detail = self._get_detail(session)
+        getattr(detail, field).append(entry)
+        if connection.vendor == 'postgresql':
+            column = connection.ops.quote_name(FlashSessionDetail._meta.get_field(field).column)
+            FlashSessionDetail.objects.filter(pk=detail.pk).update(**{
+                field: RawSQL(f"{column} || %s::jsonb", [orjson.dumps([entry]).decode()])
+            })
+        else:
+            detail.save(update_fields=[field])
+    
+    def create_backup(
+        self,
+        session: FlashSession,
+        backup_data: bytes,
+        precomputed_checksum: Optional[str] = None
+    ) -> bool:
+        """Create and verify ECU backup
+        
+        Args:
+            session: Flash session the backup belongs to
+            backup_data: Raw ECU dump
+            precomputed_checksum: SHA-256 hex digest of backup_data if the
+                flasher already produced one; skips hashing the dump again
+        """
         try:
             # Store backup (in real implementation, this would go to secure storage)
-            backup_checksum = hashlib.sha256(backup_data).hexdigest()
+            backup_checksum = precomputed_checksum or hashlib.sha256(backup_data).hexdigest()
             
-            # Update session with backup info
-            session.pre_flash_backup_url = f"backups/{session.id}/original.bin"
-            session.pre_flash_ecu_data = {
-                'backup_size': len(backup_data),
-                'backup_checksum': backup_checksum,
-                'created_at': timezone.now().isoformat()
-            }
-            session.backup_verified = True
-            session.save()
-            
-            # Log backup creation
-            SafetyAuditLog.objects.create(
-                user=session.user,
-                action_type='BACKUP_CREATED',
-                description=f'ECU backup created for flash session {session.id}',
-                flash_session=session,
-                metadata={
+            # The session, detail, audit and progress writes commit together
+            # rather than as separate autocommit transactions.
+            with transaction.atomic():
+                # Update session with backup info
+                session.pre_flash_backup_url = f"backups/{session.id}/original.bin"
+                detail = self._get_detail(session)
+                detail.pre_flash_ecu_data = {
                     'backup_size': len(backup_data),
-                    'checksum': backup_checksum
+                    'backup_checksum': backup_checksum,
+                    'created_at': timezone.now().isoformat()
                 }
-            )
-            
-            self.update_flash_progress(session, 'BACKING_UP', 20, {
-                'backup_verified': True,
-                'backup_size': len(backup_data)
-            })
+                session.backup_verified = True
+                session.save()
+                detail.save(update_fields=['pre_flash_ecu_data'])
+                
+                # Log backup creation
+                SafetyAuditLog.objects.create(
+                    user_id=session.user_id,
+                    action_type='BACKUP_CREATED',
+                    description=f'ECU backup created for flash session {session.id}',
+                    flash_session=session,
+                    metadata={
+                        'backup_size': len(backup_data),
+                        'checksum': backup_checksum
+                    }
+                )
+                
+                self.update_flash_progress(session, 'BACKING_UP', 20, {
+                    'backup_verified': True,
+                    'backup_size': len(backup_data)
+                })
             
             return True
             
         except Exception as e:
             logger.error(f"Backup creation failed for session {session.id}: {str(e)}")
-            session.error_messages.append(f"Backup creation failed: {str(e)}")
-            session.save()
+            self._record_error(session, f"Backup creation failed: {str(e)}")
             return False
     
     def validate_pre_flash(self, session: FlashSession) -> Dict:
@@ -504,14 +694,15 @@ class SafeFlashService:
         if getattr(session.tune_file, 'track_only', False):
             required_consents.append('TRACK_ONLY')
         
-        missing_consents = []
-        for consent_type in required_consents:
-            if not UserSafetyConsent.objects.filter(
-                user=session.user,
-                consent_type=consent_type,
+        # One query for all required types instead of an exists() per type
+        granted = set(
+            UserSafetyConsent.objects.filter(
+                user_id=session.user_id,
+                consent_type__in=required_consents,
                 revoked_at__isnull=True
-            ).exists():
-                missing_consents.append(consent_type)
+            ).values_list('consent_type', flat=True)
+        )
+        missing_consents = [consent for consent in required_consents if consent not in granted]
         
         return {
             'passed': len(missing_consents) == 0,
@@ -538,24 +729,24 @@ class SafeFlashService:
     
     def _check_tune_validation(self, session: FlashSession) -> Dict:
         """Check tune validation status"""
-        try:
-            validation = TuneValidation.objects.filter(
-                tune_file=session.tune_file,
-                status='PASSED'
-            ).latest('validated_at')
-            
-            return {
-                'passed': True,
-                'issues': [],
-                'warnings': validation.warnings,
-                'validation_id': str(validation.id)
-            }
-        except TuneValidation.DoesNotExist:
+        validation = TuneValidation.objects.filter(
+            tune_file_id=session.tune_file_id,
+            status='PASSED'
+        ).order_by('-validated_at').first()
+        
+        if validation is None:
             return {
                 'passed': False,
                 'issues': ["Tune has not passed safety validation"],
                 'warnings': []
             }
+        
+        return {
+            'passed': True,
+            'issues': [],
+            'warnings': validation.warnings,
+            'validation_id': str(validation.id)
+        }
     
     def _check_hardware_connection(self, session: FlashSession) -> Dict:
         """Verify hardware connection is stable"""
@@ -577,8 +768,8 @@ class SafeFlashService:
     def handle_flash_failure(self, session: FlashSession, error_message: str):
         """Handle flash failure with automatic recovery"""
         session.current_stage = 'FAILED'
-        session.error_messages.append(error_message)
         session.save()
+        self._record_error(session, error_message)
         
         # Attempt automatic recovery
         if session.backup_verified:
@@ -586,14 +777,14 @@ class SafeFlashService:
         
         # Log incident
         SafetyIncident.objects.create(
-            reporter=session.user,
+            reporter_id=session.user_id,
             incident_type='FLASH_FAILURE',
             severity='HIGH',
             title=f'Flash failure in session {session.id}',
             description=error_message,
             flash_session=session,
-            tune_file=session.tune_file,
-            motorcycle=session.motorcycle,
+            tune_file_id=session.tune_file_id,
+            motorcycle_id=session.motorcycle_id,
             error_logs=[error_message],
             system_state={
                 'stage': session.current_stage,
@@ -616,7 +807,7 @@ class SafeFlashService:
             
             # Log restoration
             SafetyAuditLog.objects.create(
-                user=session.user,
+                user_id=session.user_id,
                 action_type='BACKUP_RESTORED',
                 description=f'ECU backup restored for session {session.id}',
                 flash_session=session,
@@ -627,9 +818,12 @@ class SafeFlashService:
             
         except Exception as e:
             logger.error(f"Backup restoration failed for session {session.id}: {str(e)}")
-            session.error_messages.append(f"Backup restoration failed: {str(e)}")
-            session.save()
+            self._record_error(session, f"Backup restoration failed: {str(e)}")
             return False
+    
+    def _record_error(self, session: FlashSession, message: str):
+        """Append an error message to the session's detail row"""
+        self._append_detail_entry(session, 'error_messages', message)
 
 
 class SafetyConsentService:
@@ -735,6 +929,13 @@ I accept responsibility for backup creation and maintenance.
         """
     }
     
+    # Fingerprint of each text, computed once at import and stored with every
+    # consent so the exact wording agreed to can be verified later.
+    CONSENT_TEXT_HASHES = {
+        consent_type: hashlib.sha256(text.encode('utf-8')).hexdigest()
+        for consent_type, text in CONSENT_TEXTS.items()
+    }
+    
     def get_required_consents(self, tune_file, motorcycle) -> List[str]:
         """Get list of required consents for a specific tune/bike combination"""
         required = ['GENERAL_LIABILITY', 'ECU_MODIFICATION', 'BACKUP_RESPONSIBILITY']
@@ -743,21 +944,19 @@ I accept responsibility for backup creation and maintenance.
         if motorcycle.year >= 2015:
             required.append('WARRANTY_VOID')
         
-        # Add emissions consent for street bikes
-        if not getattr(tune_file, 'track_only', False):
-            required.append('EMISSIONS_COMPLIANCE')
-        
-        # Add track-only consent
+        # Track-only tunes need the track consent, street tunes the emissions one
         if getattr(tune_file, 'track_only', False):
             required.append('TRACK_ONLY')
+        else:
+            required.append('EMISSIONS_COMPLIANCE')
         
-        # Add expert consent for high-risk tunes
-        validation = TuneValidation.objects.filter(
+        # Add expert consent for high-risk tunes. Deliberately not cached: a
+        # new high-risk validation must take effect on the next request in
+        # every worker.
+        if TuneValidation.objects.filter(
             tune_file=tune_file,
             risk_level__in=['HIGH', 'CRITICAL']
-        ).first()
-        
-        if validation:
+        ).exists():
             required.append('EXPERT_TUNE')
         
         return required
@@ -768,9 +967,9 @@ I accept responsibility for backup creation and maintenance.
         consent_type: str, 
         ip_address: str, 
         user_agent: str,
-        motorcycle=None,
-        tune_file=None,
-        flash_session=None
+        motorcycle_id=None,
+        tune_file_id=None,
+        flash_session_id=None
     ) -> UserSafetyConsent:
         """Record user consent with full tracking"""
         
@@ -778,11 +977,12 @@ I accept responsibility for backup creation and maintenance.
             user=user,
             consent_type=consent_type,
             consent_text=self.CONSENT_TEXTS[consent_type],
+            consent_text_hash=self.CONSENT_TEXT_HASHES[consent_type],
             user_ip_address=ip_address,
             user_agent=user_agent,
-            motorcycle=motorcycle,
-            tune_file=tune_file,
-            flash_session=flash_session
+            motorcycle_id=motorcycle_id,
+            tune_file_id=tune_file_id,
+            flash_session_id=flash_session_id
         )
         
         # Log consent
@@ -804,21 +1004,26 @@ I accept responsibility for backup creation and maintenance.
         missing = []
         expired = []
         
+        # Latest active consent per type, from a single query ordered newest first
+        latest_expiry = {}
+        for consent_type, expires_at in UserSafetyConsent.objects.filter(
+            user=user,
+            consent_type__in=required_consents,
+            revoked_at__isnull=True
+        ).order_by('-consented_at').values_list('consent_type', 'expires_at'):
+            latest_expiry.setdefault(consent_type, expires_at)
+        
+        now = timezone.now()
         for consent_type in required_consents:
-            consent = UserSafetyConsent.objects.filter(
-                user=user,
-                consent_type=consent_type,
-                revoked_at__isnull=True
-            ).first()
-            
-            if not consent:
+            if consent_type not in latest_expiry:
                 missing.append(consent_type)
-            elif consent.expires_at and consent.expires_at < timezone.now():
+            elif latest_expiry[consent_type] and latest_expiry[consent_type] < now:
                 expired.append(consent_type)
         
         return {
             'has_all_consents': len(missing) == 0 and len(expired) == 0,
             'missing': missing,
             'expired': expired,
+            'granted': list(latest_expiry),
             'required': required_consents
         } 
\ No newline at end of file
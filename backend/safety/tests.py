@@ -0,0 +1,73 @@
+from django.test import SimpleTestCase
+
+from .services import ComprehensiveTuneValidator
+
+LIMITS = {
+    'min_afr': 11.5,
+    'max_afr': 16.0,
+    'afr_warning_lean': 12.0,
+    'afr_warning_rich': 15.0,
+    'max_ignition_advance': 45,
+    'min_ignition_advance': -10,
+    # As _load_safety_profiles renders the model values: the AFR limits are
+    # two-place DecimalFields, the ignition limits IntegerFields
+    'display': {
+        'min_afr': '11.50',
+        'max_afr': '16.00',
+        'afr_warning_lean': '12.00',
+        'afr_warning_rich': '15.00',
+        'max_ignition_advance': '45',
+        'min_ignition_advance': '-10',
+    },
+}
+
+
+class MapValidationTest(SimpleTestCase):
+    def setUp(self):
+        self.validator = ComprehensiveTuneValidator()
+
+    def test_afr_map_rejects_missing_and_non_finite_cells(self):
+        violations, warnings = self.validator._validate_afr_map(
+            [12.5, None, float('nan'), 13.0], LIMITS
+        )
+        self.assertEqual(violations, [
+            'AFR value None at position 1 is not a valid number - map may be corrupted',
+            'AFR value nan at position 2 is not a valid number - map may be corrupted',
+        ])
+        self.assertEqual(warnings, [])
+
+    def test_ignition_map_rejects_missing_and_non_finite_cells(self):
+        violations, _ = self.validator._validate_ignition_timing(
+            [30, None, float('inf')], LIMITS
+        )
+        self.assertEqual(violations, [
+            'Ignition timing value None at position 1 is not a valid number - map may be corrupted',
+            'Ignition timing value inf at position 2 is not a valid number - map may be corrupted',
+        ])
+
+    def test_afr_map_rejects_string_cells(self):
+        violations, _ = self.validator._validate_afr_map([12.5, '14.7', '9.0'], LIMITS)
+        self.assertEqual(violations, [
+            "AFR value '14.7' at position 1 is not a valid number - map may be corrupted",
+            "AFR value '9.0' at position 2 is not a valid number - map may be corrupted",
+        ])
+
+    def test_afr_messages_match_model_formatting(self):
+        violations, warnings = self.validator._validate_afr_map(
+            [11.0, 17.0, 11.8, 15.5], LIMITS
+        )
+        self.assertEqual(violations, [
+            'AFR value 11.0 at position 0 is dangerously lean (minimum: 11.50)',
+            'AFR value 17.0 at position 1 is too rich (maximum: 16.00)',
+        ])
+        self.assertEqual(warnings, [
+            'AFR value 11.8 at position 2 is approaching lean limit',
+            'AFR value 15.5 at position 3 is approaching rich limit',
+        ])
+
+    def test_ignition_messages_match_model_formatting(self):
+        violations, _ = self.validator._validate_ignition_timing([50, -20.5], LIMITS)
+        self.assertEqual(violations, [
+            'Ignition advance 50° at position 0 exceeds safe maximum 45°',
+            'Ignition retard -20.5° at position 1 exceeds safe minimum -10°',
+        ])
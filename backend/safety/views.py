@@ -1,3 +1,8 @@
+import base64
+import binascii
+import uuid
+from datetime import datetime, timedelta
+
 from rest_framework import status, viewsets, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -5,25 +10,39 @@ from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.db import transaction
+from django.db.models import CharField, Count, F, Q, Value
+from django.db.models.functions import Concat
 from django.http import JsonResponse
 from typing import Dict, List
 
 from .models import (
     SafetyProfile, TuneValidation, FlashSession, 
-    UserSafetyConsent, SafetyIncident, SafetyAuditLog
+    SafetyIncident, SafetyAuditLog
+)
+from .cache import (
+    cache_tune_validation, count_audit_logs, get_cached_tune_validation,
+    get_or_compute_validation_result, get_top_incident_types
 )
 from .services import (
-    ComprehensiveTuneValidator, SafeFlashService, SafetyConsentService
+    ComprehensiveTuneValidator, SafeFlashService, SafetyConsentService, get_safety_profile
 )
 from .serializers import (
     SafetyProfileSerializer, TuneValidationSerializer, FlashSessionSerializer,
-    SafetyConsentSerializer, SafetyIncidentSerializer, ValidationResultSerializer
+    FlashSessionDetailSerializer, SafetyConsentSerializer, SafetyIncidentSerializer,
+    SafetyIncidentListSerializer, ValidationResultSerializer
 )
 from tunes.models import TuneFile
 from motorcycles.models import Motorcycle
 from marketplace.models import TunePurchase
 
 
+# The services keep no per-request state, so one instance each is shared
+# across requests and threads
+_TUNE_VALIDATOR = ComprehensiveTuneValidator()
+_FLASH_SERVICE = SafeFlashService()
+_CONSENT_SERVICE = SafetyConsentService()
+
+
 class SafetyProfileViewSet(viewsets.ReadOnlyModelViewSet):
     """Read-only viewset for safety profiles"""
     
@@ -42,7 +61,7 @@ class SafetyProfileViewSet(viewsets.ReadOnlyModelViewSet):
             )
         
         try:
-            profile = SafetyProfile.objects.get(category=category)
+            profile = get_safety_profile(category)
             serializer = self.get_serializer(profile)
             return Response(serializer.data)
         except SafetyProfile.DoesNotExist:
@@ -79,13 +98,20 @@ class TuneValidationView(APIView):
         
         # Check if validation already exists and is valid
         if not force_revalidate:
-            existing_validation = TuneValidation.objects.filter(
-                tune_file=tune_file,
-                status='PASSED'
+            cached_validation = get_cached_tune_validation(tune_file.id)
+            if cached_validation is not None:
+                return Response({
+                    'validation': cached_validation,
+                    'cached': True
+                })
+            
+            existing_validation = TuneValidationSerializer.setup_eager_loading(
+                TuneValidation.objects.filter(tune_file=tune_file, status='PASSED')
             ).first()
             
             if existing_validation and not self._validation_expired(existing_validation):
                 serializer = TuneValidationSerializer(existing_validation)
+                cache_tune_validation(existing_validation, serializer.data)
                 return Response({
                     'validation': serializer.data,
                     'cached': True
@@ -93,7 +119,7 @@ class TuneValidationView(APIView):
         
         # Get safety profile
         try:
-            safety_profile = SafetyProfile.objects.get(category=bike_category)
+            safety_profile = get_safety_profile(bike_category)
         except SafetyProfile.DoesNotExist:
             return Response(
                 {'error': f'Safety profile not found for category: {bike_category}'},
@@ -101,7 +127,7 @@ class TuneValidationView(APIView):
             )
         
         # Perform validation
-        validator = ComprehensiveTuneValidator()
+        validator = _TUNE_VALIDATOR
         
         # In real implementation, this would read the actual tune file
         tune_file_data = b"mock_tune_data"  # Placeholder
@@ -126,40 +152,51 @@ class TuneValidationView(APIView):
             'expert_tune': False
         }
         
-        validation_result = validator.validate_tune(
-            tune_file_data, tune_metadata, bike_category
-        )
+        def run_validator():
+            return validator.validate_tune(tune_file_data, tune_metadata, bike_category)
         
-        # Create validation record
-        validation = TuneValidation.objects.create(
-            tune_file=tune_file,
-            safety_profile=safety_profile,
-            validator=request.user,
-            validation_level='STANDARD',
-            status='PASSED' if validation_result.is_safe else 'FAILED',
-            risk_level=validation_result.risk_level,
-            checksum_valid=validation_result.checksum_valid,
-            parameter_check_passed=validation_result.parameter_check_passed,
-            validation_data=validation_result.validation_data,
-            safety_violations=validation_result.violations,
-            warnings=validation_result.warnings
-        )
+        # An explicit revalidation always reruns the validator
+        if force_revalidate:
+            validation_result = run_validator()
+        else:
+            validation_result = get_or_compute_validation_result(
+                tune_file, safety_profile, run_validator
+            )
         
-        # Log validation
-        SafetyAuditLog.objects.create(
-            user=request.user,
-            action_type='TUNE_VALIDATION',
-            description=f'Tune validation performed for {tune_file.name}',
-            tune_file=tune_file,
-            metadata={
-                'validation_id': str(validation.id),
-                'risk_level': validation_result.risk_level,
-                'violations_count': len(validation_result.violations),
-                'warnings_count': len(validation_result.warnings)
-            }
-        )
+        # Validation row and its audit entry commit together in one transaction
+        with transaction.atomic():
+            # Create validation record
+            validation = TuneValidation.objects.create(
+                tune_file=tune_file,
+                safety_profile=safety_profile,
+                validator=request.user,
+                validation_level='STANDARD',
+                status='PASSED' if validation_result.is_safe else 'FAILED',
+                risk_level=validation_result.risk_level,
+                checksum_valid=validation_result.checksum_valid,
+                parameter_check_passed=validation_result.parameter_check_passed,
+                validation_data=validation_result.validation_data,
+                safety_violations=validation_result.violations,
+                warnings=validation_result.warnings
+            )
+            
+            # Log validation
+            SafetyAuditLog.objects.create(
+                user=request.user,
+                action_type='TUNE_VALIDATION',
+                description=f'Tune validation performed for {tune_file.name}',
+                tune_file=tune_file,
+                metadata={
+                    'validation_id': str(validation.id),
+                    'risk_level': validation_result.risk_level,
+                    'violations_count': len(validation_result.violations),
+                    'warnings_count': len(validation_result.warnings)
+                }
+            )
         
         serializer = TuneValidationSerializer(validation)
+        if validation.status == 'PASSED':
+            cache_tune_validation(validation, serializer.data)
         return Response({
             'validation': serializer.data,
             'result': ValidationResultSerializer(validation_result).data,
@@ -179,8 +216,16 @@ class FlashSessionViewSet(viewsets.ModelViewSet):
     serializer_class = FlashSessionSerializer
     permission_classes = [permissions.IsAuthenticated]
     
+    def get_serializer_class(self):
+        # Only the list endpoint skips the heavy log/snapshot columns
+        if self.action == 'list':
+            return FlashSessionSerializer
+        return FlashSessionDetailSerializer
+    
     def get_queryset(self):
-        return FlashSession.objects.filter(user=self.request.user)
+        return self.get_serializer_class().setup_eager_loading(
+            FlashSession.objects.filter(user=self.request.user)
+        )
     
     @action(detail=False, methods=['post'])
     def initiate(self, request):
@@ -196,16 +241,20 @@ class FlashSessionViewSet(viewsets.ModelViewSet):
             )
         
         try:
-            tune_file = TuneFile.objects.get(id=tune_id)
             motorcycle = Motorcycle.objects.get(id=motorcycle_id, user=request.user)
             purchase = None
             
             if purchase_id:
-                purchase = TunePurchase.objects.get(
+                # The purchase is scoped to this tune, so its listing's
+                # tune file comes back in the same query
+                purchase = TunePurchase.objects.select_related('listing__tune_file').get(
                     id=purchase_id, 
                     user=request.user,
-                    listing__tune_file=tune_file
+                    listing__tune_file_id=tune_id
                 )
+                tune_file = purchase.listing.tune_file
+            else:
+                tune_file = TuneFile.objects.get(id=tune_id)
         except (TuneFile.DoesNotExist, Motorcycle.DoesNotExist, TunePurchase.DoesNotExist) as e:
             return Response(
                 {'error': str(e)},
@@ -213,7 +262,7 @@ class FlashSessionViewSet(viewsets.ModelViewSet):
             )
         
         # Initialize flash service
-        flash_service = SafeFlashService()
+        flash_service = _FLASH_SERVICE
         
         try:
             session = flash_service.initiate_flash_session(
@@ -246,7 +295,7 @@ class FlashSessionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        flash_service = SafeFlashService()
+        flash_service = _FLASH_SERVICE
         flash_service.update_flash_progress(session, stage, progress, data)
         
         serializer = self.get_serializer(session)
@@ -260,7 +309,7 @@ class FlashSessionViewSet(viewsets.ModelViewSet):
         # In real implementation, this would receive backup data
         backup_data = b"mock_backup_data"  # Placeholder
         
-        flash_service = SafeFlashService()
+        flash_service = _FLASH_SERVICE
         success = flash_service.create_backup(session, backup_data)
         
         if success:
@@ -277,7 +326,7 @@ class FlashSessionViewSet(viewsets.ModelViewSet):
         """Perform comprehensive pre-flash validation"""
         session = self.get_object()
         
-        flash_service = SafeFlashService()
+        flash_service = _FLASH_SERVICE
         validation_result = flash_service.validate_pre_flash(session)
         
         return Response(validation_result)
@@ -288,7 +337,7 @@ class FlashSessionViewSet(viewsets.ModelViewSet):
         session = self.get_object()
         error_message = request.data.get('error_message', 'Emergency stop requested by user')
         
-        flash_service = SafeFlashService()
+        flash_service = _FLASH_SERVICE
         flash_service.handle_flash_failure(session, error_message)
         
         serializer = self.get_serializer(session)
@@ -299,7 +348,7 @@ class FlashSessionViewSet(viewsets.ModelViewSet):
         """Restore ECU from backup"""
         session = self.get_object()
         
-        flash_service = SafeFlashService()
+        flash_service = _FLASH_SERVICE
         success = flash_service.restore_backup(session)
         
         if success:
@@ -337,25 +386,21 @@ class SafetyConsentView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        consent_service = SafetyConsentService()
+        consent_service = _CONSENT_SERVICE
         required_consents = consent_service.get_required_consents(tune_file, motorcycle)
         consent_status = consent_service.check_consents(request.user, required_consents)
         
+        consent_texts = {
+            consent_type: SafetyConsentService.CONSENT_TEXTS.get(consent_type, '')
+            for consent_type in required_consents
+        }
+        
         return Response({
             'required_consents': required_consents,
-            'granted_consents': [
-                consent.consent_type 
-                for consent in UserSafetyConsent.objects.filter(
-                    user=request.user,
-                    consent_type__in=required_consents,
-                    revoked_at__isnull=True
-                )
-            ],
+            # Same rows check_consents already fetched, no second query
+            'granted_consents': consent_status['granted'],
             'consent_status': consent_status,
-            'consent_texts': {
-                consent_type: SafetyConsentService.CONSENT_TEXTS.get(consent_type, '')
-                for consent_type in required_consents
-            }
+            'consent_texts': consent_texts,
         })
     
     def post(self, request):
@@ -371,37 +416,14 @@ class SafetyConsentView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Get optional related objects
-        tune_file = None
-        motorcycle = None
-        flash_session = None
-        
-        if tune_id:
-            try:
-                tune_file = TuneFile.objects.get(id=tune_id)
-            except TuneFile.DoesNotExist:
-                pass
-        
-        if motorcycle_id:
-            try:
-                motorcycle = Motorcycle.objects.get(id=motorcycle_id, user=request.user)
-            except Motorcycle.DoesNotExist:
-                pass
-        
-        if flash_session_id:
-            try:
-                flash_session = FlashSession.objects.get(
-                    id=flash_session_id, 
-                    user=request.user
-                )
-            except FlashSession.DoesNotExist:
-                pass
+        # Keep only the optional related ids that resolve, checked in one query
+        found = self._existing_related(request.user, tune_id, motorcycle_id, flash_session_id)
         
         # Get client information
         ip_address = self._get_client_ip(request)
         user_agent = request.META.get('HTTP_USER_AGENT', '')
         
-        consent_service = SafetyConsentService()
+        consent_service = _CONSENT_SERVICE
         
         try:
             consent = consent_service.record_consent(
@@ -409,9 +431,9 @@ class SafetyConsentView(APIView):
                 consent_type=consent_type,
                 ip_address=ip_address,
                 user_agent=user_agent,
-                motorcycle=motorcycle,
-                tune_file=tune_file,
-                flash_session=flash_session
+                motorcycle_id=motorcycle_id if 'motorcycle' in found else None,
+                tune_file_id=tune_id if 'tune_file' in found else None,
+                flash_session_id=flash_session_id if 'flash_session' in found else None
             )
             
             serializer = SafetyConsentSerializer(consent)
@@ -423,6 +445,25 @@ class SafetyConsentView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
+    def _existing_related(self, user, tune_id, motorcycle_id, flash_session_id):
+        """Names of the supplied related objects that exist, via one UNION ALL"""
+        lookups = []
+        if tune_id:
+            lookups.append(TuneFile.objects.filter(id=tune_id).order_by().values(
+                kind=Value('tune_file', output_field=CharField())
+            ))
+        if motorcycle_id:
+            lookups.append(Motorcycle.objects.filter(id=motorcycle_id, user=user).order_by().values(
+                kind=Value('motorcycle', output_field=CharField())
+            ))
+        if flash_session_id:
+            lookups.append(FlashSession.objects.filter(id=flash_session_id, user=user).order_by().values(
+                kind=Value('flash_session', output_field=CharField())
+            ))
+        if not lookups:
+            return set()
+        return {row['kind'] for row in lookups[0].union(*lookups[1:], all=True)}
+    
     def _get_client_ip(self, request):
         """Get client IP address from request"""
         x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
@@ -438,11 +479,32 @@ class SafetyIncidentViewSet(viewsets.ModelViewSet):
     
     serializer_class = SafetyIncidentSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # URLs keep addressing incidents by their UUID
+    lookup_field = 'public_id'
+    lookup_url_kwarg = 'pk'
+    
+    def get_serializer_class(self):
+        # List responses leave out (and don't SELECT) the JSON blobs
+        if self.action == 'list':
+            return SafetyIncidentListSerializer
+        return SafetyIncidentSerializer
     
     def get_queryset(self):
-        if self.request.user.is_staff:
-            return SafetyIncident.objects.all()
-        return SafetyIncident.objects.filter(reporter=self.request.user)
+        queryset = SafetyIncident.objects.all()
+        if not self.request.user.is_staff:
+            queryset = queryset.filter(reporter=self.request.user)
+        return self.get_serializer_class().setup_eager_loading(queryset)
+    
+    def list(self, request, *args, **kwargs):
+        # Rows are read with .values() and rendered without a serializer
+        # instance per incident; the response shape is unchanged
+        queryset = SafetyIncidentListSerializer.values_queryset(
+            self.filter_queryset(self.get_queryset())
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(SafetyIncidentListSerializer.list_rows(page))
+        return Response(SafetyIncidentListSerializer.list_rows(queryset))
     
     def perform_create(self, serializer):
         serializer.save(reporter=self.request.user)
@@ -453,7 +515,7 @@ class SafetyIncidentViewSet(viewsets.ModelViewSet):
             action_type='INCIDENT_REPORTED',
             description=f'Safety incident reported: {serializer.instance.title}',
             metadata={
-                'incident_id': str(serializer.instance.id),
+                'incident_id': str(serializer.instance.public_id),
                 'incident_type': serializer.instance.incident_type,
                 'severity': serializer.instance.severity
             }
@@ -486,7 +548,7 @@ class SafetyIncidentViewSet(viewsets.ModelViewSet):
             action_type='EXPERT_REVIEW',
             description=f'Safety incident investigated: {incident.title}',
             metadata={
-                'incident_id': str(incident.id),
+                'incident_id': str(incident.public_id),
                 'tune_action': tune_action,
                 'resolved': True
             }
@@ -496,6 +558,22 @@ class SafetyIncidentViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
+def _encode_audit_cursor(log):
+    """Opaque cursor pointing just past an audit log entry"""
+    raw = f'{log.timestamp.isoformat()}|{log.public_id}'
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_audit_cursor(cursor):
+    """Inverse of _encode_audit_cursor; raises ValueError on a malformed cursor"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, public_id = raw.split('|')
+        return datetime.fromisoformat(timestamp), uuid.UUID(public_id)
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(str(e)) from e
+
+
 class SafetyAuditView(APIView):
     """API for safety audit logs"""
     
@@ -508,7 +586,11 @@ class SafetyAuditView(APIView):
         start_date = request.query_params.get('start_date')
         end_date = request.query_params.get('end_date')
         
-        queryset = SafetyAuditLog.objects.all()
+        # Join the user and hydrate only the columns the response needs
+        queryset = SafetyAuditLog.objects.select_related('user').only(
+            'public_id', 'user__username', 'action_type', 'description',
+            'metadata', 'timestamp', 'ip_address'
+        )
         
         if action_type:
             queryset = queryset.filter(action_type=action_type)
@@ -519,20 +601,55 @@ class SafetyAuditView(APIView):
         if end_date:
             queryset = queryset.filter(timestamp__lte=end_date)
         
-        # Pagination
-        page_size = min(int(request.query_params.get('page_size', 50)), 100)
-        page = int(request.query_params.get('page', 1))
+        # Keyset pagination: seek past the last (timestamp, public_id) seen
+        # instead of making the database scan and discard OFFSET rows
+        try:
+            page_size = int(request.query_params.get('page_size', 50))
+        except ValueError:
+            return Response({'error': 'Invalid page_size'}, status=status.HTTP_400_BAD_REQUEST)
+        page_size = max(1, min(page_size, 100))
+        cursor = request.query_params.get('cursor')
+        include_total = request.query_params.get('include_total') == '1'
+        
+        # Counting is a full scan of the filtered set, so it is opt-in and
+        # briefly cached for clients that ask for it on every page
+        total_count = count_audit_logs(queryset, {
+            'action_type': action_type,
+            'user_id': user_id,
+            'start_date': start_date,
+            'end_date': end_date,
+        }) if include_total else None
+        
+        if cursor:
+            try:
+                cursor_ts, cursor_id = _decode_audit_cursor(cursor)
+            except ValueError:
+                return Response(
+                    {'error': 'Invalid cursor'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            queryset = queryset.filter(
+                Q(timestamp__lt=cursor_ts) |
+                Q(timestamp=cursor_ts, public_id__lt=cursor_id)
+            )
         
-        total_count = queryset.count()
-        start_index = (page - 1) * page_size
-        end_index = start_index + page_size
+        # Fetch one extra row to know whether another page exists
+        logs = list(queryset.order_by('-timestamp', '-public_id')[:page_size + 1])
+        has_more = len(logs) > page_size
+        logs = logs[:page_size]
+        next_cursor = _encode_audit_cursor(logs[-1]) if has_more else None
         
-        logs = queryset[start_index:end_index]
+        pagination = {
+            'page_size': page_size,
+            'next_cursor': next_cursor,
+        }
+        if include_total:
+            pagination['total_count'] = total_count
         
         return Response({
             'logs': [
                 {
-                    'id': str(log.id),
+                    'id': str(log.public_id),
                     'user': log.user.username if log.user else None,
                     'action_type': log.action_type,
                     'description': log.description,
@@ -542,12 +659,7 @@ class SafetyAuditView(APIView):
                 }
                 for log in logs
             ],
-            'pagination': {
-                'page': page,
-                'page_size': page_size,
-                'total_count': total_count,
-                'total_pages': (total_count + page_size - 1) // page_size,
-            }
+            'pagination': pagination,
         })
 
 
@@ -559,101 +671,72 @@ class SafetyDashboardView(APIView):
     def get(self, request):
         """Get safety dashboard data"""
         # Time range for metrics
-        from datetime import datetime, timedelta
         now = timezone.now()
         week_ago = now - timedelta(days=7)
         month_ago = now - timedelta(days=30)
         
-        # Flash session metrics
-        total_flash_sessions = FlashSession.objects.count()
-        recent_flash_sessions = FlashSession.objects.filter(
-            started_at__gte=week_ago
-        ).count()
-        failed_flash_sessions = FlashSession.objects.filter(
-            current_stage='FAILED',
-            started_at__gte=month_ago
-        ).count()
-        
-        # Validation metrics
-        total_validations = TuneValidation.objects.count()
-        high_risk_tunes = TuneValidation.objects.filter(
-            risk_level__in=['HIGH', 'CRITICAL']
-        ).count()
-        failed_validations = TuneValidation.objects.filter(
-            status='FAILED'
-        ).count()
-        
-        # Incident metrics
-        total_incidents = SafetyIncident.objects.count()
-        recent_incidents = SafetyIncident.objects.filter(
-            created_at__gte=week_ago
-        ).count()
-        critical_incidents = SafetyIncident.objects.filter(
-            severity='CRITICAL',
-            resolved_at__isnull=True
-        ).count()
+        # One conditional aggregate per model instead of a count() per metric
+        flash_metrics = FlashSession.objects.aggregate(
+            total=Count('id'),
+            recent=Count('id', filter=Q(started_at__gte=week_ago)),
+            failed=Count('id', filter=Q(current_stage='FAILED', started_at__gte=month_ago)),
+        )
+        validation_metrics = TuneValidation.objects.aggregate(
+            total=Count('id'),
+            high_risk=Count('id', filter=Q(risk_level__in=['HIGH', 'CRITICAL'])),
+            failed=Count('id', filter=Q(status='FAILED')),
+        )
+        incident_metrics = SafetyIncident.objects.aggregate(
+            total=Count('id'),
+            recent=Count('id', filter=Q(created_at__gte=week_ago)),
+            critical=Count('id', filter=Q(severity='CRITICAL', resolved_at__isnull=True)),
+        )
         
         # Top incident types
-        incident_types = SafetyIncident.objects.filter(
-            created_at__gte=month_ago
-        ).values('incident_type').annotate(
-            count=models.Count('id')
-        ).order_by('-count')[:5]
-        
-        # Recent critical events
-        critical_events = []
-        
-        # Critical incidents
-        critical_events.extend([
-            {
-                'type': 'CRITICAL_INCIDENT',
-                'title': incident.title,
-                'severity': incident.severity,
-                'timestamp': incident.created_at.isoformat(),
-                'id': str(incident.id)
-            }
-            for incident in SafetyIncident.objects.filter(
-                severity='CRITICAL'
-            ).order_by('-created_at')[:10]
-        ])
-        
-        # Failed flash sessions
-        critical_events.extend([
+        incident_types = get_top_incident_types(days=30)
+        
+        # Recent critical events: both sources are merged, sorted and limited
+        # in one UNION ALL so only the 20 newest rows leave the database
+        critical_incidents_qs = SafetyIncident.objects.filter(
+            severity='CRITICAL'
+        ).order_by().values(
+            event_type=Value('CRITICAL_INCIDENT', output_field=CharField()),
+            event_title=F('title'),
+            event_severity=F('severity'),
+            event_timestamp=F('created_at'),
+            event_id=F('public_id'),
+        )
+        failed_sessions_qs = FlashSession.objects.filter(
+            current_stage='FAILED'
+        ).order_by().values(
+            event_type=Value('FLASH_FAILURE', output_field=CharField()),
+            event_title=Concat(
+                Value('Flash failure for '), F('tune_file__name'), output_field=CharField()
+            ),
+            event_severity=Value('HIGH', output_field=CharField()),
+            event_timestamp=F('started_at'),
+            event_id=F('id'),
+        )
+        critical_events = [
             {
-                'type': 'FLASH_FAILURE',
-                'title': f'Flash failure for {session.tune_file.name}',
-                'severity': 'HIGH',
-                'timestamp': session.started_at.isoformat(),
-                'id': str(session.id)
+                'type': event['event_type'],
+                'title': event['event_title'],
+                'severity': event['event_severity'],
+                'timestamp': event['event_timestamp'].isoformat(),
+                'id': str(event['event_id'])
             }
-            for session in FlashSession.objects.filter(
-                current_stage='FAILED'
-            ).order_by('-started_at')[:10]
-        ])
-        
-        # Sort and limit critical events
-        critical_events.sort(key=lambda x: x['timestamp'], reverse=True)
-        critical_events = critical_events[:20]
+            for event in critical_incidents_qs.union(
+                failed_sessions_qs, all=True
+            ).order_by('-event_timestamp')[:20]
+        ]
         
         return Response({
             'metrics': {
-                'flash_sessions': {
-                    'total': total_flash_sessions,
-                    'recent': recent_flash_sessions,
-                    'failed': failed_flash_sessions,
-                },
-                'validations': {
-                    'total': total_validations,
-                    'high_risk': high_risk_tunes,
-                    'failed': failed_validations,
-                },
-                'incidents': {
-                    'total': total_incidents,
-                    'recent': recent_incidents,
-                    'critical': critical_incidents,
-                }
+                'flash_sessions': flash_metrics,
+                'validations': validation_metrics,
+                'incidents': incident_metrics,
             },
-            'incident_types': list(incident_types),
+            'incident_types': incident_types,
             'critical_events': critical_events,
             'generated_at': now.isoformat()
         }) 
\ No newline at end of file
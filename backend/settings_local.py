@@ -2,6 +2,8 @@
 Local settings for testing motorcycle database population
 """
 
+from decouple import config
+
 from revsync.settings import *
 
 # Use SQLite for local testing
@@ -15,4 +17,12 @@ DATABASES = {
 # Disable some dependencies for faster testing
 CELERY_TASK_ALWAYS_EAGER = True
 DEBUG = True
-ALLOWED_HOSTS = ['*'] 
\ No newline at end of file
+ALLOWED_HOSTS = ['*'] 
+
+# Opt-in N+1 query detection (ENABLE_ZEAL=True). Off by default because it
+# raises on every lazy relation load in every app, not just the one being
+# worked on.
+if config('ENABLE_ZEAL', default=False, cast=bool):
+    INSTALLED_APPS = INSTALLED_APPS + ['zeal']
+    MIDDLEWARE = MIDDLEWARE + ['zeal.middleware.zeal_middleware']
+    ZEAL_RAISE = True
@@ -290,7 +290,9 @@ class UserDashboardSerializer(serializers.ModelSerializer):
         ]
     
     def get_recent_rides(self, obj):
-        recent_rides = obj.ride_sessions.order_by('-start_time')[:5]
+        recent_rides = obj.ride_sessions.select_related(
+            'motorcycle__manufacturer', 'motorcycle__category', 'motorcycle__engine_type'
+        ).order_by('-start_time')[:5]
         return RideSessionSerializer(recent_rides, many=True).data
     
     def get_recent_achievements(self, obj):
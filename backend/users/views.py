@@ -450,10 +450,15 @@ def user_analytics(request):
         start_date = timezone.now() - timedelta(days=int(period))
         rides = rides.filter(start_time__gte=start_date)
     
-    # Basic stats
-    total_rides = rides.count()
-    total_distance = rides.aggregate(Sum('distance_km'))['distance_km__sum'] or 0
-    total_time = rides.aggregate(Sum('duration_minutes'))['duration_minutes__sum'] or 0
+    # Basic stats, in one aggregate query
+    summary = rides.aggregate(
+        total_rides=Count('id'),
+        total_distance=Sum('distance_km'),
+        total_time=Sum('duration_minutes'),
+    )
+    total_rides = summary['total_rides']
+    total_distance = summary['total_distance'] or 0
+    total_time = summary['total_time'] or 0
     
     # Riding patterns
     rides_by_type = rides.values('ride_type').annotate(count=Count('id'))